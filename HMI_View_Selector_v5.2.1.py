@@ -1,19 +1,30 @@
 #!/usr/bin/env python3
 
 
+import asyncio
+import bisect
+import glob
+import itertools
 import json
 import os
 import re
 import shutil
+import socket
+import struct
 import subprocess
 import threading
 import time
 import tkinter as tk
 from tkinter import messagebox, ttk
-import configparser
+from collections import defaultdict, deque
+import functools
 import hashlib  # For secure password hashing
+import hmac
+import ipaddress
 from concurrent.futures import ThreadPoolExecutor
-from pymodbus.client import ModbusTcpClient
+from datetime import datetime
+import psutil
+from pymodbus.client import AsyncModbusTcpClient, ModbusTcpClient
 
 # Software version and metadata
 __version__ = "5.2.1"
@@ -22,6 +33,218 @@ __license__ = "MIT"
 __status__ = "Production"
 
 
+# Shared canvas item options for the unit monitor tiles (built once, not per item)
+_LBL_STYLE = dict(font=("Segoe UI", 8), fill='white', anchor='w')
+_VALUE_STYLE = dict(font=("Segoe UI", 9, "bold"), fill='#00ff00')
+_BATTERY_VALUE_STYLE = dict(_VALUE_STYLE, font=("Segoe UI", 11, "bold"))
+_VALUE_BOX_STYLE = dict(fill='#1e1e1e', outline='#555555')
+
+# Unit monitor tile size on the canvas, in pixels
+_TILE_WIDTH = 340
+_TILE_HEIGHT = 112
+
+# Body of the [cRIO] section in PumperHMI.ini (up to the next section header), and its IPAddress line.
+# Keys are case-insensitive and quotes optional, as configparser read them
+_CRIO_SECTION_RE = re.compile(r'^\[cRIO\][ \t]*$(.*?)(?=^\[|\Z)', re.M | re.S)
+_IP_RE = re.compile(r'^[ \t]*IPAddress[ \t]*[=:][ \t]*"?([^"\r\n]*?)"?[ \t]*$', re.M | re.I)
+
+# Valid setpoint entry: a whole number from 50 to 100 (ASCII digits only)
+_SETPOINT_RE = re.compile(r'(?:[5-9][0-9]|100)')
+
+# PumperHMI.ini contents for HMI version 8 and version 1 units; only the IP varies
+_INI_V8 = ("[cRIO]\nIPAddress = \"{ip}\"\n"
+           "Webservice Name = WebService\n"
+           "Webservice Port = 8002\n\n"
+           "[HMI]\nWindow State = Invalid\n")
+_INI_V1 = ("[PumperHMI]\n"
+           "server.app.propertiesEnabled=True\n"
+           "server.ole.enabled=True\n"
+           "server.tcp.paranoid=True\n"
+           'server.tcp.serviceName="My Computer/VI Server"\n'
+           "server.vi.callsEnabled=True\n"
+           "server.vi.propertiesEnabled=True\n"
+           'WebServer.TcpAccess="c+*"\n'
+           'WebServer.ViAccess="+*"\n'
+           "DebugServerEnabled=False\n"
+           "DebugServerWaitOnLaunch=False\n"
+           "blinkFG=00FF0000\n\n"
+           "[cRIO]\n"
+           "IPAddress = \"{ip}\"\n"
+           "Webservice Name = WebService\n"
+           "Webservice Port = 8002\n\n"
+           "[HMI]\n"
+           'Window State="Standard"\n'
+           "Resizable?=True\n"
+           "TimeZone=-21600\n")
+
+
+@functools.lru_cache(maxsize=256)
+def _read_ip_cached(ini_path, mtime_ns):
+    """Parse the IP out of a PumperHMI.ini; mtime_ns is only part of the cache key"""
+    # The files are tiny and only the IP is needed, so skip ConfigParser and match directly -
+    # but only inside [cRIO], the section ConfigParser was asked for
+    with open(ini_path, 'r') as f:
+        section = _CRIO_SECTION_RE.search(f.read())
+    match = section and _IP_RE.search(section.group(1))
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json_cached(path, mtime_ns, size):
+    """Parse a JSON file; mtime_ns and size are only part of the cache key"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _load_json(path):
+    """Parsed JSON for path, re-read only when the file changes - shared, so callers must not mutate it"""
+    st = os.stat(path)
+    return _read_json_cached(path, st.st_mtime_ns, st.st_size)
+
+
+# Registers polled for each 230xx unit on the monitor page, split by how quickly they change.
+# The fast tier drives the status light and fan button; battery, turbo temp and setpoint move slowly.
+_FAST_INPUT_REGISTERS = (5,)            # PLC status bits
+_FAST_HOLDING_REGISTERS = (1000,)       # Fan control
+_SLOW_INPUT_REGISTERS = (2027, 2075)    # Battery %, Turbo Temp
+_SLOW_HOLDING_REGISTERS = (1212,)       # Setpoint (maintenance mode only)
+_FAST_POLL_INTERVAL = 0.5  # seconds
+_SLOW_POLL_INTERVAL = 3.0  # seconds
+_OPS_POLL_INTERVAL = 2.0  # seconds between operations page cycles
+_OPS_MAX_POLL_INTERVAL = 8.0  # seconds - longest back-off for a unit whose values aren't changing
+_OPS_STABLE_POLLS = 3  # identical polls per extra interval of back-off
+
+# Registers polled on the operations page; _plan_reads coalesces each set into a few windowed reads
+_OPS_HOLDING_REGISTERS = (246, 270, 494, 495)       # RPM, Gear, PE Oil Rate (float)
+_OPS_INPUT_REGISTERS = (2002, 2033, 2034, 2035,     # V1/V2/GLT bits, GB Oil Rate (float), Gas PSI,
+                        2044, 8023, 8024)           # Envolts, PPatrol (float)
+_LFPC_OPS_HOLDING_REGISTERS = (246, 250, 270, 373)  # RPM, Gas Sub, Gear, Load %
+_LFPC_OPS_INPUT_REGISTERS = (8023, 8024)            # PPatrol (float)
+# Operations page alarm palette; the dim shades are the off phase of a flashing value
+_ALARM_RED = '#ff0000'
+_DIM_RED = '#800000'
+_AMBER = '#ffaa00'
+_DIM_AMBER = '#cc8800'
+_OK_GREEN = '#00ff00'
+# Alarm bands as (on, off) colour pairs, lowest band first; a band whose colours differ flashes
+_PPATROL_LIMITS = (60, 80)  # PPatrol is amber from 45 up to 60, red up to 80, flashing red above
+_PPATROL_COLORS = ((_OK_GREEN, _OK_GREEN), (_AMBER, _AMBER), (_ALARM_RED, _ALARM_RED), (_ALARM_RED, _DIM_RED))
+_GAS_PSI_LIMITS = (85, 100)  # Gas PSI flashes red below 85, flashes amber below 100
+_GAS_PSI_COLORS = ((_ALARM_RED, _DIM_RED), (_AMBER, _DIM_AMBER), (_OK_GREEN, _OK_GREEN))
+# Indicator lit by each bit of input register 302002: V1 (.05), V2 (.06), GLT (.07)
+_REG2002_INDICATORS = (('v1_indicator', 1 << 5), ('v2_indicator', 1 << 6), ('glt_indicator', 1 << 7))
+
+# Operations tile layout: rows of (left, right) (widget key, caption) cells, and the 230xx indicator lights
+_OPS_ROWS = ((('envolts_value', "Env State:"), ('rpm_value', "RPM:")),
+             (('pe_oil_value', "High Rate:"), ('gb_oil_value', "Low Rate:")),
+             (('gas_psi_value', "Gas PSI:"), ('gear_value', "Gear:")))
+_LFPC_OPS_ROWS = ((('gas_sub_value', "Gas Sub %:"), ('load_value', "Load %:")),
+                  (('rpm_value', "RPM:"), ('gear_value', "Gear:")))
+_OPS_INDICATORS = (('ppatrol_indicator', "PPatrol", 16), ('v1_indicator', "V1", 12),
+                   ('v2_indicator', "V2", 12), ('glt_indicator', "GLT", 12))  # key, caption, dot size
+
+_MAX_READ_COUNT = 125  # Modbus limit on registers per read request
+_MODBUS_PORT = 502  # Default Modbus/TCP port; connections are pooled per (ip, port)
+_REFRESH_INTERVAL = 10.0  # seconds - unchanged widget values are still re-applied this often
+_FLASH_HALF_PERIOD = 1.5  # seconds each flashing widget spends in its on / off colour
+_FLASH_TICK_MS = 400  # operations page alarm flash: milliseconds per on / off phase
+_MAX_CONCURRENT_POLLS = 8  # polls allowed on the wire at once; the rest wait their turn
+_MAX_CONCURRENT_SCANS = 64  # addresses probed at once during an IP scan
+_SCAN_TIMEOUT = 3.0  # seconds - connect plus reads for one scanned address
+_SCAN_POOL_IDLE = 60.0  # seconds after a scan before its pooled sockets are closed
+_SCAN_PROGRESS_MS = 50  # milliseconds between scan progress bar redraws
+
+
+# Formats compiled once at import instead of parsed on every float decode
+_WORDS_BE = struct.Struct('>2H')
+_FLOAT32_BE = struct.Struct('>f')
+_PUMP_NAME_BE = struct.Struct('>10H')
+
+
+def _decode_float(registers, offset=0):
+    """IEEE-754 float from registers[offset] (high word) and registers[offset + 1]; works on lists and address dicts"""
+    return _FLOAT32_BE.unpack(_WORDS_BE.pack(registers[offset], registers[offset + 1]))[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _plan_reads(addresses):
+    """Coalesce sorted register addresses into (start, count) reads of at most _MAX_READ_COUNT registers"""
+    plan = []
+    for address in addresses:
+        if plan and address - plan[-1][0] < _MAX_READ_COUNT:
+            plan[-1] = (plan[-1][0], address - plan[-1][0] + 1)
+        else:
+            plan.append((address, 1))
+    return tuple(plan)
+
+
+def _word(registers, address):
+    """Single unsigned register value"""
+    return registers[address]
+
+
+def _gear_text(value):
+    """Gear number 1-9, or "N" for anything else"""
+    return str(value) if 1 <= value <= 9 else "N"
+
+
+def _render_gear(value):
+    gear_display = _gear_text(value)
+    # Red for "N", white for valid gear numbers
+    return {'text': gear_display, 'foreground': _ALARM_RED if gear_display == "N" else 'white'}, None
+
+
+def _render_oil_rate(value):
+    # Red if less than 34, green otherwise
+    return {'text': f"{value:.2f}", 'foreground': _ALARM_RED if value < 34 else _OK_GREEN}, None
+
+
+def _render_gas_psi(value):
+    # Below 85 = flashing red, below 100 = flashing amber, otherwise green
+    return {'text': str(value)}, ('foreground', _GAS_PSI_COLORS[bisect.bisect_right(_GAS_PSI_LIMITS, value)])
+
+
+def _render_ppatrol(value):
+    # Indicator colour only. Band 0 below 45, 1 up to 60, 2 up to 80, 3 above (limits are exclusive above 45)
+    band = bisect.bisect_left(_PPATROL_LIMITS, value) + (value >= 45)
+    return {}, ('fg', _PPATROL_COLORS[band])
+
+
+def _render_lfpc_gas_sub(value):
+    gas_sub_value, gear_display = value
+    # Red when in gear with no gas substitution, green otherwise
+    color = _ALARM_RED if gear_display != "N" and gas_sub_value == 0 else _OK_GREEN
+    return {'text': f"{gas_sub_value}%", 'foreground': color}, None
+
+
+# Operations tile readouts, one row per widget: (register table, address, widget key, decoder, renderer).
+# The decoder pulls the value out of the polled {address: value} dict; the renderer returns
+# (config options, alarm band), where an alarm band is (colour option, (on, off) colours) for _set_band.
+_OPS_READOUTS = (
+    ('holding', 246, 'rpm_value', _word,  # Red if under 1200, green otherwise
+     lambda v: ({'text': str(v), 'foreground': _ALARM_RED if v < 1200 else _OK_GREEN}, None)),
+    ('input', 2044, 'envolts_value', _word,  # Green if 5, red otherwise
+     lambda v: ({'text': str(v), 'foreground': _OK_GREEN if v == 5 else _ALARM_RED}, None)),
+    ('holding', 494, 'pe_oil_value', _decode_float, _render_oil_rate),
+    ('input', 2033, 'gb_oil_value', _decode_float, _render_oil_rate),
+    ('input', 2035, 'gas_psi_value', _word, _render_gas_psi),
+    ('holding', 270, 'gear_value', _word, _render_gear),
+    ('input', 8023, 'ppatrol_indicator', _decode_float, _render_ppatrol),
+)
+_LFPC_OPS_READOUTS = (
+    ('holding', 246, 'rpm_value', _word,  # Red if 0, green otherwise
+     lambda v: ({'text': str(v), 'foreground': _ALARM_RED if v == 0 else _OK_GREEN}, None)),
+    ('holding', 270, 'gear_value', _word, _render_gear),
+    # Gas Sub colour depends on the gear, which is always read in the same request
+    ('holding', 250, 'gas_sub_value', lambda regs, a: (regs[a], _gear_text(regs[270])), _render_lfpc_gas_sub),
+    ('holding', 373, 'load_value', _word, lambda v: ({'text': f"{v}%"}, None)),
+    ('input', 8023, 'ppatrol_indicator', _decode_float, _render_ppatrol),
+)
+# Per unit type: (holding registers, input registers, readouts)
+_OPS_REGMAP = (_OPS_HOLDING_REGISTERS, _OPS_INPUT_REGISTERS, _OPS_READOUTS)
+_LFPC_OPS_REGMAP = (_LFPC_OPS_HOLDING_REGISTERS, _LFPC_OPS_INPUT_REGISTERS, _LFPC_OPS_READOUTS)
+
+
 class HoverButton(tk.Button):
     def __init__(self, master=None, hover_color=None, **kwargs):
         super().__init__(master, **kwargs)
@@ -43,6 +266,27 @@ class HoverButton(tk.Button):
         super().config(**kwargs)
 
 
+class CanvasField:
+    """Label-like handle on a canvas text item and/or its box, so monitor updates can call config()"""
+    def __init__(self, canvas, text_item=None, box_item=None):
+        self.canvas = canvas
+        self.text_item = text_item
+        self.box_item = box_item
+
+    def config(self, text=None, fg=None, bg=None):
+        if self.text_item is not None:
+            options = {key: value for key, value in (('text', text), ('fill', fg)) if value is not None}
+            if options:
+                self.canvas.itemconfigure(self.text_item, **options)
+        if bg is not None and self.box_item is not None:
+            self.canvas.itemconfigure(self.box_item, fill=bg)
+
+    configure = config
+
+    def winfo_exists(self):
+        return self.canvas.winfo_exists()
+
+
 class ModernApp:
     def __init__(self, root):
         self.root = root
@@ -65,16 +309,29 @@ class ModernApp:
         self.auto_control_active = False
         self.auto_threshold = 1050  # Turbo temp threshold for auto-control activation
         self.monitoring_active = False
-        self.monitor_threads = []  # Initialize monitor threads list
+        self._loop = None  # asyncio event loop (background thread) used for monitor page polling
+        self._monitor_future = None  # concurrent Future of the latest run_monitor_cycles coroutine - the next session waits on it
+        self._stop_event = None  # asyncio.Event that wakes run_monitor_cycles when monitoring stops
+        self.async_connection_pool = {}  # AsyncModbusTcpClient per (ip, port), only touched on the event loop
+        self.scan_connection_pool = {}  # Same for IP scans - kept apart so ending a monitor session doesn't close it
+        self._scan_pool_expiry = None  # loop TimerHandle that closes scan_connection_pool once scans go idle
+        self.async_connection_locks = defaultdict(asyncio.Lock)  # Per (ip, port) - one outstanding request per socket
         self.was_monitoring_before_navigation = False  # Track monitoring state across page transitions
-        self.connection_pool = {}  # Connection pool for Modbus clients
+        self.connection_pool = {}  # Connection pool for Modbus clients, keyed by (ip, port) so gateway units share a socket
+        self.connection_locks = defaultdict(threading.Lock)  # Per (ip, port) lock - one request sequence at a time per pooled client
+        self._pool_lock = threading.Lock()  # Guards creating and clearing connection_pool entries
         self.visible_units = []  # Track currently visible units for selective polling
+        self._widgets_alive = False  # False once the current monitor grid_frame has been destroyed
+        self._dirty_updates = {}  # id(widgets) -> (widgets, pending options) waiting for the next flush
+        self._dirty_lock = threading.Lock()  # Guards _dirty_updates / _flush_scheduled across the loop and Tk threads
+        self._flush_scheduled = False
+        self._flash_job = None  # after() id of the running _flash_tick, if any
+        self._flash_phase = False
         
         # Preload units info container
         self.units_info = []
         
         # Auto fan control timing - track last fan activation time per unit
-        self.last_fan_activation = {}  # Dictionary to store last activation time per unit IP
         
         # IP range configuration - default values
         self.ip_start = [10, 55, 10, 100]
@@ -89,9 +346,21 @@ class ModernApp:
         self.users = {}  # Will store user data with roles
         self.current_user = None  # Currently logged in user
         self.current_user_role = None  # Current user's role
+        self._active_admin_count = 0  # Cached count of active admins (kept in sync on create/delete)
+        self._last_config_hash = None  # Hash of the last config.json contents written
+        self._users_text = None  # User table on the user management page (updated in place)
+        self._activity_log_widget = None  # Activity log tree (new entries are inserted in place)
+        self._config_dirty = False  # config.json has unsaved changes
+        self._pending_log_entries = []  # Activity log entries not yet appended to activity_log.json
+        self._config_flush_id = None  # Pending root.after id for the debounced save
+        self._pages = {}  # Pages built once and re-shown: name -> (frame, pack options)
+        self._operations_page = None  # (units key, units_info, grid_frame, start_button, stop_button) of the cached page
         self.maintenance_password = ""  # Legacy support
         self.ip_setup_password = ""    # Legacy support
-        self.activity_log = []  # Activity log for tracking changes
+        self._login_cache = {}  # (username, password digest) -> role, successful logins only
+        self.activity_log_max = 10_000  # Only the newest entries are kept in memory (config.json "activity_log_max")
+        self.activity_log = deque(maxlen=self.activity_log_max)  # Activity log for tracking changes (newest first)
+        self._activity_by_action = defaultdict(deque)  # Per-action view of activity_log for fast filtering
         self.master_maintenance_mode = False  # Master maintenance mode for global SP control
         self.load_user_config()  # Load user configuration from config file
         self.load_activity_log()  # Load activity log
@@ -102,9 +371,25 @@ class ModernApp:
         
         # Initialize variables
         self.exe_folder = "Digi_Prime_HMIs"
+        self._exe_cache = {'dirs': {}, 'files': [], 'choices': ("Select Pump",)}  # Last get_exe_files scan, keyed by every scanned folder's mtime
+        self._exe_by_name = {}  # Dropdown name ("Pump", no .exe) -> full path, rebuilt with the cache
+        self._unit_folders_cache = None  # (folder mtime, unit folder candidates) from _find_unit_folders
+        self._io_pool = ThreadPoolExecutor(max_workers=4)  # Process launches and other blocking I/O
+        self._assignments_cache = None  # Last loaded/saved pump assignments
+        self._last_saved_assignments = None  # Contents of pump_assignments.json as last read/written
+        self._unit_to_pump_map = None  # Unit name -> pump number, derived from the assignments cache
+        self._units_order_cache = None  # (pump map, unit names, sorted indexes) from units_by_pump
         self.exe_files = self.get_exe_files()
         self.pump_assignments = self.load_assignments()
         
+        # Flush any debounced saves when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Track whether the main window is on screen so display-only polling can pause while minimized
+        self._window_visible = True
+        self.root.bind('<Map>', self._on_root_map_change, add='+')
+        self.root.bind('<Unmap>', self._on_root_map_change, add='+')
+        
         # Load logo
         self.logo = tk.PhotoImage(file='Logo.png')
 
@@ -123,6 +408,18 @@ class ModernApp:
                            background='#0078d4',
                            foreground='white')
         
+        # Operations tiles: frames, captions and value readouts each share one style
+        self.style.configure('Ops.TFrame', background='#2d2d2d')
+        self.style.configure('Ops.TLabel', background='#2d2d2d', foreground='white', font=('Segoe UI', 9))
+        self.style.configure('OpsCaption.TLabel', background='#2d2d2d', foreground='white', font=('Segoe UI', 8))
+        self.style.configure('OpsValue.TLabel',
+                           background='#1a1a1a',
+                           foreground='#00ff00',
+                           font=('Segoe UI', 10, 'bold'),
+                           relief='sunken',
+                           borderwidth=1,
+                           anchor='center')
+        
         # Configure Combobox style
         self.style.configure('TCombobox',
                            fieldbackground='#2d2d2d',
@@ -140,8 +437,7 @@ class ModernApp:
         self.create_ini_page()
 
     def create_ini_page(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         # Logo at the top
         logo_label = tk.Label(self.root, image=self.logo, bg='#1e1e1e')
@@ -191,8 +487,7 @@ class ModernApp:
         ip_setup_button.grid(row=3, column=0, pady=15, ipadx=10, ipady=5)
 
     def create_ini_page2(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True)
@@ -238,8 +533,7 @@ class ModernApp:
         ip_setup_button.grid(row=3, column=0, pady=15, ipadx=10, ipady=5)
 
     def create_ini2(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True)
@@ -294,8 +588,7 @@ class ModernApp:
             messagebox.showerror("Invalid Input", "Please enter a valid number.")
 
     def create_main_page(self, num_pumps):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root)
         self.current_frame.configure(bg='#1e1e1e')
@@ -323,7 +616,8 @@ class ModernApp:
 
         # Update exe files
         self.exe_files = self.get_exe_files()
-        exe_names = [os.path.basename(file)[:-4] for file in self.exe_files]
+        # Dropdown choices come with the listing get_exe_files just validated, not rebuilt per page
+        pump_choices = self._exe_cache['choices']
 
         # Calculate rows and columns
         rows = (num_pumps + 1) // 2
@@ -346,7 +640,7 @@ class ModernApp:
             # Modern styled dropdown
             dropdown = ttk.Combobox(
                 grid_frame,
-                values=["Select Pump"] + exe_names,
+                values=pump_choices,
                 state="readonly",
                 width=18,
                 font=("Segoe UI", 11)
@@ -426,8 +720,7 @@ class ModernApp:
         operations_button.pack(side='left', padx=10, ipady=5)
 
     def create_main_page2(self, num_pumps):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root)
         self.current_frame.configure(bg='#1e1e1e')
@@ -455,7 +748,8 @@ class ModernApp:
 
         # Update exe files
         self.exe_files = self.get_exe_files()
-        exe_names = [os.path.basename(file)[:-4] for file in self.exe_files]
+        # Dropdown choices come with the listing get_exe_files just validated, not rebuilt per page
+        pump_choices = self._exe_cache['choices']
 
         # Calculate number of columns needed (max 12 pumps per column)
         num_columns = (num_pumps + 11) // 12
@@ -480,7 +774,7 @@ class ModernApp:
             # Modern styled dropdown
             dropdown = ttk.Combobox(
                 grid_frame,
-                values=["Select Pump"] + exe_names,
+                values=pump_choices,
                 state="readonly",
                 width=18,
                 font=("Segoe UI", 11)
@@ -552,38 +846,40 @@ class ModernApp:
         operations_button.pack(side='left', padx=10, ipady=5)
 
     def first_scan(self):
-        # Delete Digi_Prime_HMIs folder before scanning
+        # scan_ip clears the Digi_Prime_HMIs folder and builds the progress page, so it has to run
+        # on the Tk thread; the probing itself happens on the background loop
+        self.scan_ip()
+
+    def _discard_hmi_folder(self):
+        """
+        Move the Digi_Prime_HMIs folder aside and delete it on a background thread
+        The rename is a single metadata operation, so the UI never waits on the delete; raises OSError if it fails
+        """
         folder_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Digi_Prime_HMIs")
-        if os.path.exists(folder_path):
-            try:
-                shutil.rmtree(folder_path)
-                print(f"Successfully deleted {folder_path}")
-            except Exception as e:
-                print(f"Error deleting {folder_path}: {e}")
-        
-        threading.Thread(target=self.scan_ip, daemon=True).start()
+        scratch = f"{folder_path}.old.{os.getpid()}.{time.time_ns()}"
+        try:
+            os.replace(folder_path, scratch)
+            print(f"Moved {folder_path} aside for deletion")
+        except FileNotFoundError:
+            pass
+
+        def delete_old():
+            # Also picks up folders left behind if the app exited before an earlier delete finished
+            for path in glob.glob(glob.escape(folder_path) + ".old.*"):
+                shutil.rmtree(path, ignore_errors=True)
+
+        threading.Thread(target=delete_old, daemon=True).start()
 
     def scan_ip(self):
-        # Delete Digi_Prime_HMIs folder before scanning
-        folder_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Digi_Prime_HMIs")
-        if os.path.exists(folder_path):
-            try:
-                shutil.rmtree(folder_path)
-                print(f"Successfully deleted {folder_path}")
-            except Exception as e:
-                print(f"Error deleting {folder_path}: {e}")
-                messagebox.showerror("Error", f"Failed to delete Digi_Prime_HMIs folder: {e}")
-                return
-        
-        # Verify folder is deleted before proceeding
-        if os.path.exists(folder_path):
-            messagebox.showerror("Error", "Failed to delete Digi_Prime_HMIs folder. Cannot proceed with scan.")
+        # Clear the Digi_Prime_HMIs folder before scanning; once it is renamed away the scan can refill it
+        try:
+            self._discard_hmi_folder()
+        except OSError as e:
+            print(f"Error deleting Digi_Prime_HMIs: {e}")
+            messagebox.showerror("Error", f"Failed to delete Digi_Prime_HMIs folder: {e}")
             return
         
-        print("Verified: Digi_Prime_HMIs folder successfully removed")
-                
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack()
@@ -600,55 +896,28 @@ class ModernApp:
         start_last_octet = self.ip_start[3]
         end_last_octet = self.ip_end[3]
         
-        def scan_single_ip(i):
-            ip = f"{start_ip_base}.{i}"
-            client = ModbusTcpClient(ip)
-            try:
-                if client.connect():
-                    string_result = client.read_holding_registers( address=128, count=10)
-                    int_result = client.read_holding_registers( address=138, count=1)
-                    if not (string_result.isError() or int_result.isError()):
-                        self.process_scan_results(string_result, int_result, ip)
-            except Exception as e:
-                print(f"Error scanning {ip}: {e}")
-            finally:
-                client.close()
-
-        def run_scan():
-            ip_range = list(range(start_last_octet, end_last_octet + 1))
-            total_ips = len(ip_range)
-            with ThreadPoolExecutor(max_workers=20) as executor:
-                for i, _ in enumerate(executor.map(scan_single_ip, ip_range)):
-                    progress = (i + 1) / total_ips * 100
-                    progress_bar['value'] = progress
-                    self.current_frame.update()
+        ips = [f"{start_ip_base}.{i}" for i in range(start_last_octet, end_last_octet + 1)]
 
+        def finish():
             self.current_frame.destroy()
             self.create_ini2()
 
-        threading.Thread(target=run_scan, daemon=True).start()
+        # Every address is probed concurrently on the background loop; finish back on the Tk thread
+        done = [0]
+        future = asyncio.run_coroutine_threadsafe(self.scan_ip_range(ips, done), self.get_event_loop())
+        self._track_scan_progress(progress_bar, done, len(ips))
+        future.add_done_callback(lambda f: self.root.after(0, finish))
 
     def scan_ip2(self):
-        # Delete Digi_Prime_HMIs folder before scanning
-        folder_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Digi_Prime_HMIs")
-        if os.path.exists(folder_path):
-            try:
-                shutil.rmtree(folder_path)
-                print(f"Successfully deleted {folder_path}")
-            except Exception as e:
-                print(f"Error deleting {folder_path}: {e}")
-                messagebox.showerror("Error", f"Failed to delete Digi_Prime_HMIs folder: {e}")
-                return
-        
-        # Verify folder is deleted before proceeding
-        if os.path.exists(folder_path):
-            messagebox.showerror("Error", "Failed to delete Digi_Prime_HMIs folder. Cannot proceed with scan.")
+        # Clear the Digi_Prime_HMIs folder before scanning; once it is renamed away the scan can refill it
+        try:
+            self._discard_hmi_folder()
+        except OSError as e:
+            print(f"Error deleting Digi_Prime_HMIs: {e}")
+            messagebox.showerror("Error", f"Failed to delete Digi_Prime_HMIs folder: {e}")
             return
         
-        print("Verified: Digi_Prime_HMIs folder successfully removed")
-        
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack()
@@ -665,37 +934,20 @@ class ModernApp:
         start_last_octet = self.ip_start[3]
         end_last_octet = self.ip_end[3]
         
-        def scan_single_ip(i):
-            ip = f"{start_ip_base}.{i}"
-            client = ModbusTcpClient(ip)
-            try:
-                if client.connect():
-                    string_result = client.read_holding_registers(address=128, count=10)
-                    int_result = client.read_holding_registers(address=138, count=1)
-                    if not (string_result.isError() or int_result.isError()):
-                        self.process_scan_results(string_result, int_result, ip)
-            except Exception as e:
-                print(f"Error scanning {ip}: {e}")
-            finally:
-                client.close()
-
-        def run_scan():
-            ip_range = list(range(start_last_octet, end_last_octet + 1))
-            total_ips = len(ip_range)
-            with ThreadPoolExecutor(max_workers=16) as executor:
-                for i, _ in enumerate(executor.map(scan_single_ip, ip_range)):
-                    progress = (i + 1) / total_ips * 100
-                    progress_bar['value'] = progress
-                    self.current_frame.update()
+        ips = [f"{start_ip_base}.{i}" for i in range(start_last_octet, end_last_octet + 1)]
 
+        def finish():
             self.current_frame.destroy()
             self.load_existing_configuration()
 
-        threading.Thread(target=run_scan, daemon=True).start()
+        # Every address is probed concurrently on the background loop; finish back on the Tk thread
+        done = [0]
+        future = asyncio.run_coroutine_threadsafe(self.scan_ip_range(ips, done), self.get_event_loop())
+        self._track_scan_progress(progress_bar, done, len(ips))
+        future.add_done_callback(lambda f: self.root.after(0, finish))
 
     def create_ip_setup_page(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True)
@@ -816,47 +1068,30 @@ class ModernApp:
 
     def save_ip_config(self):
         try:
-            # Validate and save IP ranges
-            start_ip = []
-            end_ip = []
+            # Validate and save IP ranges - collect all 8 octets in one pass
+            values = [entry.get().strip() for entry in itertools.chain(self.start_ip_entries, self.end_ip_entries)]
             
-            # Enhanced IPv4 validation for start IP
-            for i, entry in enumerate(self.start_ip_entries):
-                value_str = entry.get().strip()
-                # Check if entry is empty or not a valid number
-                if not value_str or not value_str.isdigit():
-                    messagebox.showerror("Invalid Input", f"Start IP octet {i+1} must be a valid number (received '{value_str}')")
-                    return
-                
-                value = int(value_str)
-                if not (0 <= value <= 255):
-                    messagebox.showerror("Invalid Input", f"Start IP octet {i+1} must be between 0 and 255")
-                    return
-                start_ip.append(value)
+            # Enhanced IPv4 validation for start and end IP
+            bad = next((i for i, v in enumerate(values) if not (v.isdigit() and int(v) <= 255)), None)
+            if bad is not None:
+                side = "Start" if bad < 4 else "End"
+                messagebox.showerror("Invalid Input", f"{side} IP octet {bad % 4 + 1} must be a number between 0 and 255 (received '{values[bad]}')")
+                return
             
-            # Enhanced IPv4 validation for end IP
-            for i, entry in enumerate(self.end_ip_entries):
-                value_str = entry.get().strip()
-                # Check if entry is empty or not a valid number
-                if not value_str or not value_str.isdigit():
-                    messagebox.showerror("Invalid Input", f"End IP octet {i+1} must be a valid number (received '{value_str}')")
-                    return
-                
-                value = int(value_str)
-                if not (0 <= value <= 255):
-                    messagebox.showerror("Invalid Input", f"End IP octet {i+1} must be between 0 and 255")
-                    return
-                end_ip.append(value)
+            octets = [int(v) for v in values]
+            start_ip = octets[:4]
+            end_ip = octets[4:]
             
             # Validate that start IP is less than or equal to end IP
-            start_ip_int = (start_ip[0] << 24) + (start_ip[1] << 16) + (start_ip[2] << 8) + start_ip[3]
-            end_ip_int = (end_ip[0] << 24) + (end_ip[1] << 16) + (end_ip[2] << 8) + end_ip[3]
+            # (built from the parsed ints so entries like '010' are normalized)
+            start_addr = ipaddress.IPv4Address('.'.join(map(str, start_ip)))
+            end_addr = ipaddress.IPv4Address('.'.join(map(str, end_ip)))
             
             # Format IP addresses for display
-            start_ip_str = f"{start_ip[0]}.{start_ip[1]}.{start_ip[2]}.{start_ip[3]}"
-            end_ip_str = f"{end_ip[0]}.{end_ip[1]}.{end_ip[2]}.{end_ip[3]}"
+            start_ip_str = str(start_addr)
+            end_ip_str = str(end_addr)
             
-            if start_ip_int > end_ip_int:
+            if start_addr > end_addr:
                 messagebox.showerror("Invalid Range", f"Start IP ({start_ip_str}) must be less than or equal to End IP ({end_ip_str})")
                 return
             
@@ -886,42 +1121,156 @@ class ModernApp:
 
     def load_ip_config(self):
         try:
-            if os.path.exists('ip_config.json'):
-                with open('ip_config.json', 'r') as f:
-                    config = json.load(f)
-                    self.ip_start = config.get('ip_start', [10, 55, 10, 100])
-                    self.ip_end = config.get('ip_end', [10, 55, 10, 255])
+            config = _load_json('ip_config.json')
+            # Copies - the parsed config is shared with the cache
+            self.ip_start = list(config.get('ip_start', [10, 55, 10, 100]))
+            self.ip_end = list(config.get('ip_end', [10, 55, 10, 255]))
+        except FileNotFoundError:
+            # No saved range yet - keep the defaults
+            pass
         except Exception as e:
             print(f"Error loading IP configuration: {e}")
             # Use default values if loading fails
             self.ip_start = [10, 55, 10, 100]
             self.ip_end = [10, 55, 10, 255]
             
-    def safe_widget_update(self, widget, **kwargs):
-        """
-        Safely update a widget's configuration, checking if it still exists
-        """
-        try:
-            if widget and widget.winfo_exists():
-                widget.config(**kwargs)
-        except tk.TclError:
-            # Widget has been destroyed, ignore the update
-            pass
-        except Exception as e:
-            # Log other unexpected errors but don't crash
-            print(f"Error updating widget: {e}")
+    def release_current_frame(self):
+        """Hide the current page if it is cached, otherwise destroy it"""
+        if self.current_frame:
+            if any(self.current_frame is frame for frame, _ in self._pages.values()):
+                self.current_frame.pack_forget()
+            else:
+                self.current_frame.destroy()
+
+    def show_cached_page(self, name):
+        """Re-show a previously built page; returns False if it still needs to be built"""
+        page = self._pages.get(name)
+        if page is None or not page[0].winfo_exists():
+            return False
+        frame, pack_options = page
+        if frame is not self.current_frame:
+            self.release_current_frame()
+            self.current_frame = frame
+        frame.pack(**pack_options)
+        return True
+
+    def cache_page(self, name, **pack_options):
+        """Pack the newly built current frame and remember it for reuse"""
+        self.current_frame.pack(**pack_options)
+        self._pages[name] = (self.current_frame, pack_options)
+
+    def _changed_updates(self, unit, widgets, pending):
+        """Drop updates identical to what was last sent to these widgets, unless that is older than _REFRESH_INTERVAL"""
+        # The memo belongs to one set of widgets; a rebuilt page starts blank and must be drawn in full
+        memo = unit.get('last_state')
+        if memo is None or memo[0] is not widgets:
+            memo = unit['last_state'] = (widgets, {}, {})
+        _, last_state, last_state_ts = memo
+        now = time.monotonic()
+        changed = {}
+        for key, options in pending.items():
+            if last_state.get(key) == options and now - last_state_ts.get(key, 0) < _REFRESH_INTERVAL:
+                continue
+            last_state[key] = options
+            last_state_ts[key] = now
+            changed[key] = options
+        return changed
+
+    def _on_root_map_change(self, event):
+        """Record whether the main window itself (not a child widget) is mapped"""
+        if event.widget is self.root:
+            self._window_visible = event.type == tk.EventType.Map
+
+    def _watch_grid_frame(self):
+        """Mark the monitor widgets alive until the new grid_frame is destroyed"""
+        self._widgets_alive = True
+        self.grid_frame.bind('<Destroy>', self._on_grid_frame_destroyed)
+
+    def _on_grid_frame_destroyed(self, event):
+        """Stop queuing widget updates once the current grid_frame goes away"""
+        # A stale frame from an earlier page being destroyed later must not clear the flag
+        if event.widget is self.grid_frame:
+            self._widgets_alive = False
+
+    def _queue_updates(self, widgets, pending):
+        """Merge a poll's widget updates into the dirty set, scheduling one Tk flush for all units"""
+        with self._dirty_lock:
+            entry = self._dirty_updates.get(id(widgets))
+            if entry is None:
+                self._dirty_updates[id(widgets)] = (widgets, dict(pending))
+            else:
+                # A newer poll of the same unit overrides anything still waiting
+                entry[1].update(pending)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after(0, self._flush_updates)
+
+    def _flush_updates(self):
+        """Apply every unit's queued widget updates in one pass on the Tk thread"""
+        with self._dirty_lock:
+            batches, self._dirty_updates = self._dirty_updates, {}
+            self._flush_scheduled = False
+        for widgets, pending in batches.values():
+            self._apply_updates(widgets, pending)
+
+    def _apply_updates(self, widgets, pending):
+        """Apply a poll's batched widget updates (widget key -> config options) on the Tk thread"""
+        # The pollers stop queuing once the grid is destroyed, so there is no per-widget
+        # winfo_exists round trip; TclError still covers an update that races a teardown
+        get_widget = widgets.get
+        for key, options in pending.items():
+            widget = get_widget(key)
+            if widget is None:
+                continue
+            try:
+                widget.config(**options)
+            except tk.TclError:
+                # Widget has been destroyed, ignore the update
+                pass
+            except Exception as e:
+                # Log other unexpected errors but don't crash
+                print(f"Error updating widget: {e}")
 
     def hash_password(self, password):
         """
-        Create a SHA-256 hash of the password
+        Hash the password with scrypt and a random salt
+        The KDF input is the SHA-256 digest so legacy SHA-256 hashes can be checked with the same digest
         """
-        return hashlib.sha256(password.encode('utf-8')).hexdigest()
+        digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        salt = os.urandom(16)
+        key = hashlib.scrypt(digest.encode(), salt=salt, n=2**14, r=8, p=1)
+        return f"scrypt${salt.hex()}${key.hex()}"
     
     def verify_password(self, input_password, stored_hash):
         """
         Verify if the input password matches the stored hash
         """
-        return self.hash_password(input_password) == stored_hash
+        return self._verify_digest(hashlib.sha256(input_password.encode('utf-8')).hexdigest(), stored_hash)
+    
+    def _verify_digest(self, digest, stored_hash):
+        """Check a SHA-256 password digest against a scrypt or legacy SHA-256 stored hash"""
+        if stored_hash.startswith("scrypt$"):
+            _, salt, key = stored_hash.split("$")
+            derived = hashlib.scrypt(digest.encode(), salt=bytes.fromhex(salt), n=2**14, r=8, p=1)
+            return hmac.compare_digest(derived.hex(), key)
+        return hmac.compare_digest(digest, stored_hash)
+    
+    def _check_credentials(self, username, password_digest):
+        """
+        Return the user's role if the credentials are valid
+        Successful logins are remembered in _login_cache, keyed by the password digest so the plaintext
+        never enters it; failures are always checked afresh
+        """
+        key = (username, password_digest)
+        role = self._login_cache.get(key)
+        if role is not None:
+            return role
+        user_data = self.users.get(username)
+        if user_data and user_data.get("active", True) and self._verify_digest(password_digest, user_data["password_hash"]):
+            role = self._login_cache[key] = user_data["role"]
+            return role
+        return None
     
     def load_user_config(self):
         """
@@ -930,63 +1279,69 @@ class ModernApp:
         """
         config_file = 'config.json'
         
-        # Default configuration with admin user and legacy passwords
-        default_config = {
-            "users": {
+        # Plain setting defaults; the admin account is only built when one has to be created,
+        # because every hash_password call is a deliberately slow scrypt
+        default_settings = {
+            "master_maintenance_mode": False,  # Default master maintenance mode state
+            "turbo_temp_threshold": 1050,  # Default turbo temperature threshold
+            "activity_log_max": 10_000  # Max activity log entries kept in memory
+        }
+        
+        def default_users():
+            return {
                 "admin": {
                     "password_hash": self.hash_password("LBRT123!"),
                     "role": "admin",
                     "active": True,
                     "created_date": "2025-01-01"
                 }
-            },
-            "maintenance_password": self.hash_password("LBRT123!"),  # Legacy support
-            "ip_setup_password": self.hash_password("LBRT123!"),    # Legacy support
-            "master_maintenance_mode": False,  # Default master maintenance mode state
-            "turbo_temp_threshold": 1050  # Default turbo temperature threshold
-        }
+            }
         
         try:
             if os.path.exists(config_file):
                 with open(config_file, 'r') as f:
                     config = json.load(f)
                 
-                # Load users if present, otherwise use default
-                self.users = config.get("users", default_config["users"])
+                # Load users if present
+                self.users = config.get("users") or {}
                 
-                # Load legacy passwords for backward compatibility
-                self.maintenance_password = config.get("maintenance_password", default_config["maintenance_password"])
-                self.ip_setup_password = config.get("ip_setup_password", default_config["ip_setup_password"])
+                # Legacy passwords are only stored and written back, never checked - no default hash needed
+                self.maintenance_password = config.get("maintenance_password", self.maintenance_password)
+                self.ip_setup_password = config.get("ip_setup_password", self.ip_setup_password)
                 
                 # Load master maintenance mode state
-                self.master_maintenance_mode = config.get("master_maintenance_mode", default_config["master_maintenance_mode"])
+                self.master_maintenance_mode = config.get("master_maintenance_mode", default_settings["master_maintenance_mode"])
                 
                 # Load turbo temperature threshold
-                self.turbo_temp_threshold = config.get("turbo_temp_threshold", default_config["turbo_temp_threshold"])
+                self.turbo_temp_threshold = config.get("turbo_temp_threshold", default_settings["turbo_temp_threshold"])
+                
+                # Load activity log size limit
+                self.activity_log_max = config.get("activity_log_max", default_settings["activity_log_max"])
                 
                 # If no users exist, add default admin
                 if not self.users:
-                    self.users = default_config["users"]
+                    self.users = default_users()
                     self.save_user_config()
             else:
                 # Create new config file with defaults
-                with open(config_file, 'w') as f:
-                    json.dump(default_config, f, indent=4)
-                
-                self.users = default_config["users"]
-                self.maintenance_password = default_config["maintenance_password"]
-                self.ip_setup_password = default_config["ip_setup_password"]
-                self.master_maintenance_mode = default_config["master_maintenance_mode"]
-                self.turbo_temp_threshold = default_config["turbo_temp_threshold"]
+                self.users = default_users()
+                # The legacy fields carry the same default password, so reuse the one hash
+                self.maintenance_password = self.ip_setup_password = self.users["admin"]["password_hash"]
+                self.master_maintenance_mode = default_settings["master_maintenance_mode"]
+                self.turbo_temp_threshold = default_settings["turbo_temp_threshold"]
+                self.activity_log_max = default_settings["activity_log_max"]
+                self.save_user_config()
                 
         except Exception as e:
             print(f"Error loading user configuration: {e}")
             # Use default values if loading fails
-            self.users = default_config["users"]
-            self.maintenance_password = default_config["maintenance_password"]
-            self.ip_setup_password = default_config["ip_setup_password"]
-            self.master_maintenance_mode = default_config["master_maintenance_mode"]
-            self.turbo_temp_threshold = default_config["turbo_temp_threshold"]
+            self.users = default_users()
+            self.master_maintenance_mode = default_settings["master_maintenance_mode"]
+            self.turbo_temp_threshold = default_settings["turbo_temp_threshold"]
+            self.activity_log_max = default_settings["activity_log_max"]
+        
+        # One scan at load time; create_user/delete_user keep the count current afterwards
+        self._active_admin_count = sum(1 for user in self.users.values() if user["role"] == "admin" and user.get("active", True))
     
     def save_user_config(self):
         """
@@ -994,17 +1349,34 @@ class ModernApp:
         """
         config_file = 'config.json'
         
+        # Every change to users, roles or passwords is saved through here, so this is the one place
+        # remembered logins are forgotten
+        self._login_cache.clear()
+        
         config = {
             "users": self.users,
             "maintenance_password": self.maintenance_password,  # Legacy support
             "ip_setup_password": self.ip_setup_password,       # Legacy support
             "master_maintenance_mode": self.master_maintenance_mode,  # Persistent master maintenance mode
-            "turbo_temp_threshold": self.turbo_temp_threshold  # Persistent turbo temperature threshold
+            "turbo_temp_threshold": self.turbo_temp_threshold,  # Persistent turbo temperature threshold
+            "activity_log_max": self.activity_log_max  # Persistent activity log size limit
         }
         
         try:
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            data = json.dumps(config, indent=4).encode()
+            # Skip the write entirely if nothing changed since the last save
+            new_hash = hashlib.blake2b(data, digest_size=16).digest()
+            if new_hash == self._last_config_hash:
+                return True
+            
+            # Write to a temp file and swap it in so a power loss can't leave a torn config.json
+            tmp_file = config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+            self._last_config_hash = new_hash
             return True
         except Exception as e:
             print(f"Error saving user configuration: {e}")
@@ -1014,13 +1386,15 @@ class ModernApp:
         """
         Authenticate a user and return their role if successful
         """
-        if username in self.users:
-            user_data = self.users[username]
-            if user_data.get("active", True) and self.verify_password(password, user_data["password_hash"]):
-                self.current_user = username
-                self.current_user_role = user_data["role"]
-                return user_data["role"]
-        return None
+        role = self._check_credentials(username, hashlib.sha256(password.encode('utf-8')).hexdigest())
+        if role:
+            self.current_user = username
+            self.current_user_role = role
+            # Upgrade legacy SHA-256 hashes to scrypt on successful login
+            if not self.users[username]["password_hash"].startswith("scrypt$"):
+                self.users[username]["password_hash"] = self.hash_password(password)
+                self.save_user_config()
+        return role
     
     def create_user(self, username, password, role, created_by_admin=True):
         """
@@ -1041,7 +1415,8 @@ class ModernApp:
             "active": True,
             "created_date": time.strftime("%Y-%m-%d")
         }
-        
+        if role == "admin":
+            self._active_admin_count += 1
         if self.save_user_config():
             return True, "User created successfully"
         else:
@@ -1061,12 +1436,13 @@ class ModernApp:
             return False, "User does not exist"
         
         # Don't allow deletion of the last admin
-        admin_count = sum(1 for user in self.users.values() if user["role"] == "admin" and user.get("active", True))
-        if self.users[username]["role"] == "admin" and admin_count <= 1:
+        user_data = self.users[username]
+        if user_data["role"] == "admin" and self._active_admin_count <= 1:
             return False, "Cannot delete the last administrator"
         
         del self.users[username]
-        
+        if user_data["role"] == "admin" and user_data.get("active", True):
+            self._active_admin_count -= 1
         if self.save_user_config():
             return True, "User deleted successfully"
         else:
@@ -1084,7 +1460,6 @@ class ModernApp:
             return False, "Insufficient permissions"
         
         self.users[username]["password_hash"] = self.hash_password(new_password)
-        
         if self.save_user_config():
             self.log_activity("Password Updated", f"Password updated for user: {username}")
             return True, "Password updated successfully"
@@ -1092,24 +1467,69 @@ class ModernApp:
             return False, "Failed to save user configuration"
     
     def load_activity_log(self):
-        """Load activity log from file"""
+        """Load the tail of the activity log from file"""
         log_file = 'activity_log.json'
+        self.activity_log = deque(maxlen=self.activity_log_max)
         try:
-            if os.path.exists(log_file):
-                with open(log_file, 'r') as f:
-                    self.activity_log = json.load(f)
-            else:
-                self.activity_log = []
+            with open(log_file, 'r') as f:
+                first = f.read(1)
+                while first.isspace():
+                    first = f.read(1)
+                legacy_array = first == '['
+                if legacy_array:
+                    # Legacy JSON array - has to be parsed whole, deque keeps only the tail
+                    f.seek(0)
+                    legacy_entries = json.load(f)
+                    self.activity_log.extendleft(legacy_entries)
+                else:
+                    # One JSON object per line - stream it so memory stays bounded
+                    f.seek(0)
+                    for line in f:
+                        if line.strip():
+                            self.activity_log.appendleft(json.loads(line))
+            if legacy_array:
+                # Convert the full history to one entry per line so later writes can append
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    f.writelines(self._log_record(entry) for entry in legacy_entries)
+        except FileNotFoundError:
+            # Nothing logged yet
+            pass
         except Exception as e:
             print(f"Error loading activity log: {e}")
-            self.activity_log = []
+            self.activity_log = deque(maxlen=self.activity_log_max)
+        self.rebuild_activity_index()
+    
+    def rebuild_activity_index(self):
+        """Rebuild the per-action index of the activity log"""
+        self._activity_by_action = defaultdict(deque)
+        for entry in self.activity_log:
+            self._activity_by_action[entry.get('action', '')].append(entry)
+    
+    def _log_record(self, entry):
+        """Serialize a log entry as one line (cached display rows are not persisted)"""
+        return json.dumps({k: v for k, v in entry.items() if not k.startswith('_')}) + "\n"
     
     def save_activity_log(self):
-        """Save activity log to file"""
+        """Rewrite the whole activity log file, one JSON entry per line, oldest first"""
+        log_file = 'activity_log.json'
+        try:
+            with open(log_file, 'w', encoding='utf-8') as f:
+                f.writelines(self._log_record(entry) for entry in reversed(self.activity_log))
+            self._pending_log_entries.clear()
+            return True
+        except Exception as e:
+            print(f"Error saving activity log: {e}")
+            return False
+    
+    def append_activity_log(self):
+        """Append pending log entries to the file instead of rewriting it"""
+        if not self._pending_log_entries:
+            return True
         log_file = 'activity_log.json'
         try:
-            with open(log_file, 'w') as f:
-                json.dump(self.activity_log, f, indent=4)
+            with open(log_file, 'a', encoding='utf-8') as f:
+                f.write("".join(self._log_record(entry) for entry in self._pending_log_entries))
+            self._pending_log_entries.clear()
             return True
         except Exception as e:
             print(f"Error saving activity log: {e}")
@@ -1117,7 +1537,7 @@ class ModernApp:
     
     def log_activity(self, action, details):
         """Log an activity with timestamp and user info"""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
         log_entry = {
             "timestamp": timestamp,
             "user": self.current_user or "Unknown",
@@ -1125,8 +1545,63 @@ class ModernApp:
             "action": action,
             "details": details
         }
-        self.activity_log.append(log_entry)
-        self.save_activity_log()
+        self.format_log_entry(log_entry)
+        # Keep the action index in step with entries the ring buffer is about to drop
+        if len(self.activity_log) == self.activity_log.maxlen:
+            oldest = self.activity_log[-1]
+            self._activity_by_action[oldest.get('action', '')].pop()
+        self.activity_log.appendleft(log_entry)  # Newest first, so views never need to sort
+        self._activity_by_action[action].appendleft(log_entry)
+        self._pending_log_entries.append(log_entry)
+        self._schedule_config_save()
+        
+        # If the log page is showing, add just this row at the top instead of rebuilding it
+        log_tree = self._activity_log_widget
+        if log_tree is not None and log_tree.winfo_exists() and self.filter_var.get() in ("All", action):
+            log_tree.delete(*log_tree.tag_has('placeholder'))
+            log_tree.insert("", 0, values=log_entry['_row'])
+    
+    def _schedule_config_save(self, config=False):
+        """Mark config/log dirty and flush them together after a short delay"""
+        if config:
+            self._config_dirty = True
+        if self._config_flush_id is None:
+            self._config_flush_id = self.root.after(2000, self._flush_config)
+    
+    def _flush_config(self):
+        """Write config.json and activity_log.json if they have pending changes"""
+        if self._config_flush_id is not None:
+            self.root.after_cancel(self._config_flush_id)
+            self._config_flush_id = None
+        if self._config_dirty:
+            self._config_dirty = False
+            self.save_user_config()
+        self.append_activity_log()
+    
+    def on_closing(self):
+        """Flush pending saves and release connections before exiting"""
+        self.monitoring_active = False
+        self._flush_config()
+        self.close_all_connections()
+        if self._loop is not None:
+            # Async sockets live on the loop; close the monitor's (if a session is still open) and the scan's there
+            self._loop.call_soon_threadsafe(self._close_async_connections)
+            self._loop.call_soon_threadsafe(self._close_async_connections, self.scan_connection_pool)
+            if self._scan_pool_expiry is not None:
+                self._loop.call_soon_threadsafe(self._scan_pool_expiry.cancel)
+        self._io_pool.shutdown(wait=False)
+        self.root.destroy()
+    
+    def format_log_entry(self, entry):
+        """Build and cache the display row for a log entry"""
+        entry['_row'] = row = (
+            entry.get('timestamp', 'Unknown'),
+            entry.get('user', 'Unknown'),
+            entry.get('role', 'Unknown'),
+            entry.get('action', 'Unknown'),
+            entry.get('details', 'No details')
+        )
+        return row
     
     def load_password_config(self):
         """
@@ -1134,47 +1609,37 @@ class ModernApp:
         If file doesn't exist, create it with default passwords
         """
         config_file = 'config.json'
-        
-        # Default configuration with hashed passwords
-        default_config = {
-            "maintenance_password": self.hash_password("LBRT123!"),  # Default hashed password
-            "ip_setup_password": self.hash_password("LBRT123!")     # Default hashed password
-        }
+        legacy_keys = ("maintenance_password", "ip_setup_password")
         
         try:
             if os.path.exists(config_file):
                 with open(config_file, 'r') as f:
                     config = json.load(f)
-                    
-                # Ensure all required keys are present
-                if all(key in config for key in default_config.keys()):
-                    self.maintenance_password = config["maintenance_password"]
-                    self.ip_setup_password = config["ip_setup_password"]
-                else:
-                    # Missing keys, use defaults for missing ones
-                    for key in default_config.keys():
-                        if key not in config:
-                            config[key] = default_config[key]
+                
+                # Missing legacy keys are filled with one hash of the default password, and only when missing
+                missing = [key for key in legacy_keys if key not in config]
+                if missing:
+                    default_hash = self.hash_password("LBRT123!")
+                    for key in missing:
+                        config[key] = default_hash
                     
                     # Save the updated config
                     with open(config_file, 'w') as f:
                         json.dump(config, f, indent=4)
-                        
-                    self.maintenance_password = config["maintenance_password"]
-                    self.ip_setup_password = config["ip_setup_password"]
+                
+                self.maintenance_password = config["maintenance_password"]
+                self.ip_setup_password = config["ip_setup_password"]
             else:
-                # Create the file with default values
+                # Create the file with default values (one hash serves both legacy fields)
+                default_hash = self.hash_password("LBRT123!")
                 with open(config_file, 'w') as f:
-                    json.dump(default_config, f, indent=4)
-                    
-                self.maintenance_password = default_config["maintenance_password"]
-                self.ip_setup_password = default_config["ip_setup_password"]
+                    json.dump(dict.fromkeys(legacy_keys, default_hash), f, indent=4)
+                
+                self.maintenance_password = self.ip_setup_password = default_hash
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load password configuration: {e}")
-            # Fallback to default hashed passwords
-            self.maintenance_password = default_config["maintenance_password"]
-            self.ip_setup_password = default_config["ip_setup_password"]
+            # The legacy passwords are never checked, so keep whatever is already loaded
     
     def save_password_config(self):
         """
@@ -1184,8 +1649,7 @@ class ModernApp:
 
     def create_user_management_login_page(self):
         """Create login page for user management access"""
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True)
@@ -1291,8 +1755,7 @@ class ModernApp:
 
     def create_user_management_page(self):
         """Create the main user management page"""
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True, fill='both', padx=20, pady=20)
@@ -1335,83 +1798,27 @@ class ModernApp:
         list_container = tk.Frame(list_frame, bg='#1e1e1e')
         list_container.pack(fill='both', expand=True, padx=10, pady=10)
 
-        # Headers
-        headers = ["Username", "Role", "Created", "Status", "Actions"]
-        for i, header in enumerate(headers):
-            tk.Label(
-                list_container,
-                text=header,
-                font=("Segoe UI", 12, "bold"),
-                bg='#1e1e1e',
-                fg='white',
-                width=12
-            ).grid(row=0, column=i, padx=5, pady=5, sticky='w')
-
-        # User rows
-        row = 1
-        for username, user_data in self.users.items():
-            # Username
-            tk.Label(
-                list_container,
-                text=username,
-                font=("Segoe UI", 10),
-                bg='#1e1e1e',
-                fg='white',
-                width=12
-            ).grid(row=row, column=0, padx=5, pady=2, sticky='w')
-
-            # Role
-            role_color = '#00ff00' if user_data['role'] == 'admin' else '#ffff00'
-            tk.Label(
-                list_container,
-                text=user_data['role'].title(),
-                font=("Segoe UI", 10),
-                bg='#1e1e1e',
-                fg=role_color,
-                width=12
-            ).grid(row=row, column=1, padx=5, pady=2, sticky='w')
-
-            # Created date
-            tk.Label(
-                list_container,
-                text=user_data.get('created_date', 'Unknown'),
-                font=("Segoe UI", 10),
-                bg='#1e1e1e',
-                fg='white',
-                width=12
-            ).grid(row=row, column=2, padx=5, pady=2, sticky='w')
-
-            # Status
-            status = "Active" if user_data.get('active', True) else "Inactive"
-            status_color = '#00ff00' if user_data.get('active', True) else '#ff0000'
-            tk.Label(
-                list_container,
-                text=status,
-                font=("Segoe UI", 10),
-                bg='#1e1e1e',
-                fg=status_color,
-                width=12
-            ).grid(row=row, column=3, padx=5, pady=2, sticky='w')
-
-            # Actions
-            action_frame = tk.Frame(list_container, bg='#1e1e1e')
-            action_frame.grid(row=row, column=4, padx=5, pady=2, sticky='w')
-
-            if self.current_user_role == 'admin' and username != self.current_user:
-                delete_btn = HoverButton(
-                    action_frame,
-                    text="Delete",
-                    command=lambda u=username: self.confirm_delete_user(u),
-                    font=("Segoe UI", 8),
-                    bg="#d83b01",
-                    fg="white",
-                    relief="flat",
-                    padx=5,
-                    hover_color="#e85b24"
-                )
-                delete_btn.pack(side='left', padx=2)
+        # Render the whole table in a single Text widget instead of 5 labels per user
+        users_text = tk.Text(
+            list_container,
+            font=("Consolas", 10),
+            bg='#1e1e1e',
+            fg='white',
+            height=len(self.users) + 1,
+            relief='flat',
+            bd=0,
+            highlightthickness=0,
+            cursor='arrow'
+        )
+        users_text.pack(fill='x')
+        users_text.tag_configure('header', font=("Consolas", 11, "bold"))
+        users_text.tag_configure('admin', foreground='#00ff00')
+        users_text.tag_configure('tech', foreground='#ffff00')
+        users_text.tag_configure('active', foreground='#00ff00')
+        users_text.tag_configure('inactive', foreground='#ff0000')
 
-            row += 1
+        self._users_text = users_text
+        self.populate_user_list(users_text)
 
         # User creation section (only for admins)
         if self.current_user_role == 'admin':
@@ -1588,6 +1995,21 @@ class ModernApp:
         )
         back_button.pack(side='left', padx=10, ipady=5)
 
+        # Activity Log button (only for admins)
+        if self.current_user_role == 'admin':
+            log_button = HoverButton(
+                nav_frame,
+                text="View Activity Log",
+                command=self.create_activity_log_page,
+                font=("Segoe UI", 14),
+                bg="#ff8c00",
+                fg="white",
+                relief="flat",
+                padx=30,
+                hover_color="#ffa500"
+            )
+            log_button.pack(side='left', padx=10, ipady=5)
+
         logout_button = HoverButton(
             nav_frame,
             text="Logout",
@@ -1601,29 +2023,99 @@ class ModernApp:
         )
         logout_button.pack(side='left', padx=10, ipady=5)
 
-    def get_modbus_connection(self, ip_address):
-        """Get or create a Modbus connection from the pool"""
-        if ip_address not in self.connection_pool:
-            self.connection_pool[ip_address] = ModbusTcpClient(ip_address)
+    def get_modbus_connection(self, ip_address, port=_MODBUS_PORT):
+        """Get or create a Modbus connection from the pool (shared by every unit behind the same ip/port)"""
+        key = (ip_address, port)
+        # Button handlers on different threads can ask for the same device at once; only one may create its client
+        with self._pool_lock:
+            client = self.connection_pool.get(key)
+            if client is None:
+                client = self.connection_pool[key] = ModbusTcpClient(ip_address, port=port)
         
-        client = self.connection_pool[ip_address]
         if not client.is_socket_open():
             try:
-                client.connect()
+                if client.connect():
+                    self._enable_keepalive(client.socket)
             except Exception as e:
                 print(f"Failed to connect to {ip_address}: {e}")
                 return None
         return client
 
+    def _enable_keepalive(self, sock):
+        """Turn on TCP keepalive so idle pooled sockets survive device-side idle timeouts"""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                # Linux: first probe after 30s idle, then every 5s, give up after 3 misses
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            elif hasattr(socket, 'SIO_KEEPALIVE_VALS'):
+                # Windows: (on, idle ms, interval ms)
+                sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, 30000, 5000))
+        except Exception as e:
+            print(f"Error enabling keepalive: {e}")
+
+    def _close_one(self, key):
+        """Close a single pooled connection"""
+        try:
+            client = self.connection_pool[key]
+            if client.is_socket_open():
+                client.close()
+        except Exception as e:
+            print(f"Error closing connection to {key[0]}:{key[1]}: {e}")
+
     def close_all_connections(self):
         """Close all connections in the pool"""
-        for ip_address, client in self.connection_pool.items():
+        if self.connection_pool:
+            # Socket teardown is I/O bound, so close them concurrently
+            with ThreadPoolExecutor(max_workers=min(32, len(self.connection_pool))) as executor:
+                # Snapshot the keys so the pool can't change size under the iteration
+                list(executor.map(self._close_one, list(self.connection_pool)))
+        with self._pool_lock:
+            self.connection_pool.clear()
+
+    async def get_async_modbus_connection(self, ip_address, port=_MODBUS_PORT, pool=None):
+        """Get or create an async Modbus connection from pool, the monitor pool by default (event loop thread only)"""
+        if pool is None:
+            pool = self.async_connection_pool
+        key = (ip_address, port)
+        if key not in pool:
+            # reconnect_delay=0 turns off pymodbus' background reconnect: callers reconnect here on demand,
+            # and a client that has been closed and dropped must stay closed
+            pool[key] = AsyncModbusTcpClient(ip_address, port=port, reconnect_delay=0)
+        client = pool[key]
+        if not client.connected:
+            try:
+                await client.connect()
+            except Exception as e:
+                print(f"Failed to connect to {ip_address}: {e}")
+                return None
+        return client
+
+    def _drop_async_connection(self, key, client, pool=None):
+        """Close and forget a pooled async client after an error (event loop thread only)"""
+        if pool is None:
+            pool = self.async_connection_pool
+        # Only if it is still the pooled one - another unit on the gateway may already have replaced it
+        if client is None or pool.get(key) is not client:
+            return
+        del pool[key]
+        try:
+            client.close()
+        except Exception as e:
+            print(f"Error closing connection to {key[0]}:{key[1]}: {e}")
+
+    def _close_async_connections(self, pool=None):
+        """Close all async connections in pool, the monitor pool by default (event loop thread only)"""
+        if pool is None:
+            pool = self.async_connection_pool
+        for key in list(pool):
             try:
-                if client.is_socket_open():
-                    client.close()
+                pool[key].close()
             except Exception as e:
-                print(f"Error closing connection to {ip_address}: {e}")
-        self.connection_pool.clear()
+                print(f"Error closing connection to {key[0]}:{key[1]}: {e}")
+        pool.clear()
 
     def toggle_master_maintenance_mode(self):
         """Toggle master maintenance mode - activates SP controls globally"""
@@ -1633,7 +2125,7 @@ class ModernApp:
         self.maintenance_mode_active = self.master_maintenance_mode
         
         # Save the state to config file for persistence
-        self.save_user_config()
+        self._schedule_config_save(config=True)
         
         # Log the activity
         status = "activated" if self.master_maintenance_mode else "deactivated"
@@ -1647,23 +2139,53 @@ class ModernApp:
             messagebox.showinfo("Master Maintenance Mode", 
                               "Master Maintenance Mode DEACTIVATED!\nSP Controls are now globally disabled.\nState saved to memory.")
         
-        # Refresh the user management page to update status display
-        self.create_user_management_page()
+        # Refresh the user management page once the dialog has closed
+        self.root.after_idle(self.create_user_management_page)
 
-        # Activity Log button (only for admins)
-        if self.current_user_role == 'admin':
-            log_button = HoverButton(
-                nav_frame,
-                text="View Activity Log",
-                command=self.create_activity_log_page,
-                font=("Segoe UI", 14),
-                bg="#ff8c00",
+    def populate_user_list(self, users_text):
+        """Render the user table into the user list Text widget"""
+        users_text.configure(state='normal', height=len(self.users) + 1)
+        users_text.delete('1.0', 'end')
+        for child in users_text.winfo_children():
+            child.destroy()  # Embedded Delete buttons from the previous render
+
+        # Headers
+        headers = ["Username", "Role", "Created", "Status", "Actions"]
+        chunks = ["".join(f"{header:<14}" for header in headers) + "\n", 'header']
+
+        # User rows - collected as (text, tags) pairs for a single batched insert
+        deletable = []
+        for line, (username, user_data) in enumerate(self.users.items(), start=2):
+            role = user_data['role']
+            active = user_data.get('active', True)
+            chunks += (
+                f"{username:<14}", (),
+                f"{role.title():<14}", 'admin' if role == 'admin' else 'tech',
+                f"{user_data.get('created_date', 'Unknown'):<14}", (),
+                f"{'Active' if active else 'Inactive':<14}", 'active' if active else 'inactive',
+                "\n", ()
+            )
+            if self.current_user_role == 'admin' and username != self.current_user:
+                deletable.append((line, username))
+
+        users_text.insert('end', *chunks)
+
+        # Actions
+        for line, username in deletable:
+            delete_btn = HoverButton(
+                users_text,
+                text="Delete",
+                command=lambda u=username: self.confirm_delete_user(u),
+                font=("Segoe UI", 8),
+                bg="#d83b01",
                 fg="white",
                 relief="flat",
-                padx=30,
-                hover_color="#ffa500"
+                padx=5,
+                hover_color="#e85b24"
             )
-            log_button.pack(side='left', padx=10, ipady=5)
+            users_text.window_create(f"{line}.end", window=delete_btn)
+
+        users_text.configure(state='disabled')
 
     def create_new_user(self):
         """Create a new user from the form"""
@@ -1690,7 +2212,7 @@ class ModernApp:
             self.new_username_entry.delete(0, tk.END)
             self.new_password_entry.delete(0, tk.END)
             self.role_var.set("tech")
-            self.create_user_management_page()  # Refresh the page
+            self.refresh_user_list()
         else:
             messagebox.showerror("Error", message)
 
@@ -1701,10 +2223,17 @@ class ModernApp:
             if success:
                 self.log_activity("User Deleted", f"Deleted user: {username}")
                 messagebox.showinfo("Success", message)
-                self.create_user_management_page()  # Refresh the page
+                self.refresh_user_list()
             else:
                 messagebox.showerror("Error", message)
 
+    def refresh_user_list(self):
+        """Update the user table in place, rebuilding the page only if it is gone"""
+        if self._users_text is not None and self._users_text.winfo_exists():
+            self.populate_user_list(self._users_text)
+        else:
+            self.create_user_management_page()
+
     def logout_user(self):
         """Logout current user"""
         self.current_user = None
@@ -1717,11 +2246,15 @@ class ModernApp:
             messagebox.showerror("Access Denied", "Only administrators can view the activity log")
             return
 
-        if self.current_frame:
-            self.current_frame.destroy()
+        # Reuse the page if it was already built - the tree is kept current by log_activity
+        if self.show_cached_page('activity_log'):
+            self._activity_log_user_label.config(text=f"Logged in as: {self.current_user} ({self.current_user_role.title()})")
+            return
+
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
-        self.current_frame.pack(expand=True, fill='both', padx=20, pady=20)
+        self.cache_page('activity_log', expand=True, fill='both', padx=20, pady=20)
 
         # Header
         header_frame = tk.Frame(self.current_frame, bg='#1e1e1e')
@@ -1744,6 +2277,7 @@ class ModernApp:
             fg='#00ff00'
         )
         user_info_label.pack(side='right')
+        self._activity_log_user_label = user_info_label
 
         # Log display frame with scrollbar
         log_frame = tk.LabelFrame(
@@ -1761,7 +2295,7 @@ class ModernApp:
         self.current_frame.grid_rowconfigure(1, weight=1)
         self.current_frame.grid_columnconfigure(0, weight=1)
 
-        # Create scrollable text widget
+        # Create scrollable log table
         log_container = tk.Frame(log_frame, bg='#1e1e1e')
         log_container.pack(fill='both', expand=True, padx=10, pady=10)
 
@@ -1769,46 +2303,30 @@ class ModernApp:
         scrollbar = tk.Scrollbar(log_container, bg='#2d2d2d', troughcolor='#1e1e1e')
         scrollbar.pack(side='right', fill='y')
 
-        # Text widget for log display
-        log_text = tk.Text(
+        # Treeview for log display - only the visible rows are drawn, unlike a Text widget
+        style = ttk.Style()
+        style.configure("Log.Treeview", background='#2d2d2d', fieldbackground='#2d2d2d',
+                        foreground='white', font=("Consolas", 10), rowheight=22)
+        style.configure("Log.Treeview.Heading", font=("Segoe UI", 10, "bold"))
+
+        log_tree = ttk.Treeview(
             log_container,
-            font=("Consolas", 10),
-            bg='#2d2d2d',
-            fg='white',
-            insertbackground='white',
-            relief='flat',
-            wrap='word',
-            yscrollcommand=scrollbar.set,
-            state='disabled'
+            columns=("ts", "user", "role", "action", "details"),
+            show="headings",
+            style="Log.Treeview",
+            yscrollcommand=scrollbar.set
         )
-        log_text.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=log_text.yview)
+        for column, heading, width in (("ts", "Timestamp", 150), ("user", "User", 100), ("role", "Role", 70),
+                                       ("action", "Action", 170), ("details", "Details", 420)):
+            log_tree.heading(column, text=heading, anchor='w')
+            log_tree.column(column, width=width, anchor='w', stretch=(column == "details"))
+        log_tree.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=log_tree.yview)
+        self._activity_log_widget = log_tree
 
         # Populate log entries
-        log_text.config(state='normal')
-        log_text.delete(1.0, tk.END)
-
-        if not self.activity_log:
-            log_text.insert(tk.END, "No activity logged yet.\n")
-        else:
-            # Sort log entries by timestamp (newest first)
-            sorted_log = sorted(self.activity_log, key=lambda x: x['timestamp'], reverse=True)
-            
-            for entry in sorted_log:
-                timestamp = entry.get('timestamp', 'Unknown')
-                user = entry.get('user', 'Unknown')
-                role = entry.get('role', 'Unknown')
-                action = entry.get('action', 'Unknown')
-                details = entry.get('details', 'No details')
-                
-                # Format log entry
-                log_entry = f"[{timestamp}] {user} ({role}) - {action}\n"
-                log_entry += f"  Details: {details}\n"
-                log_entry += "-" * 80 + "\n\n"
-                
-                log_text.insert(tk.END, log_entry)
-
-        log_text.config(state='disabled')
+        self.filter_var = tk.StringVar(value="All")
+        self.filter_activity_log(log_tree)
 
         # Filter options
         filter_frame = tk.Frame(self.current_frame, bg='#1e1e1e')
@@ -1822,7 +2340,6 @@ class ModernApp:
             fg='white'
         ).pack(side='left', padx=5)
 
-        self.filter_var = tk.StringVar(value="All")
         filter_options = ["All", "Login", "SP Controls", "Turbo Threshold Changed", "User Created", "User Deleted", "Password Updated", "IP Configuration"]
         
         filter_combo = ttk.Combobox(
@@ -1833,12 +2350,12 @@ class ModernApp:
             width=20
         )
         filter_combo.pack(side='left', padx=5)
-        filter_combo.bind('<<ComboboxSelected>>', lambda e: self.filter_activity_log(log_text))
+        filter_combo.bind('<<ComboboxSelected>>', lambda e: self.filter_activity_log(log_tree))
 
         refresh_button = HoverButton(
             filter_frame,
             text="Refresh",
-            command=lambda: self.refresh_activity_log(log_text),
+            command=lambda: self.refresh_activity_log(log_tree),
             font=("Segoe UI", 10),
             bg="#0078d4",
             fg="white",
@@ -1878,46 +2395,36 @@ class ModernApp:
         )
         clear_log_button.pack(side='left', padx=10, ipady=5)
 
-    def filter_activity_log(self, log_text):
+    def filter_activity_log(self, log_tree):
         """Filter activity log by selected action"""
         filter_value = self.filter_var.get()
         
-        log_text.config(state='normal')
-        log_text.delete(1.0, tk.END)
+        log_tree.delete(*log_tree.get_children())
 
         if not self.activity_log:
-            log_text.insert(tk.END, "No activity logged yet.\n")
+            log_tree.insert("", "end", values=("", "", "", "", "No activity logged yet."), tags=('placeholder',))
+            return
+
+        # Filter log entries - the deque is already newest-first
+        if filter_value == "All":
+            filtered_log = self.activity_log
         else:
-            # Filter and sort log entries
-            if filter_value == "All":
-                filtered_log = self.activity_log
-            else:
-                filtered_log = [entry for entry in self.activity_log if entry.get('action', '') == filter_value]
-            
-            sorted_log = sorted(filtered_log, key=lambda x: x['timestamp'], reverse=True)
-            
-            if not sorted_log:
-                log_text.insert(tk.END, f"No activities found for filter: {filter_value}\n")
-            else:
-                for entry in sorted_log:
-                    timestamp = entry.get('timestamp', 'Unknown')
-                    user = entry.get('user', 'Unknown')
-                    role = entry.get('role', 'Unknown')
-                    action = entry.get('action', 'Unknown')
-                    details = entry.get('details', 'No details')
-                    
-                    log_entry = f"[{timestamp}] {user} ({role}) - {action}\n"
-                    log_entry += f"  Details: {details}\n"
-                    log_entry += "-" * 80 + "\n\n"
-                    
-                    log_text.insert(tk.END, log_entry)
+            filtered_log = self._activity_by_action.get(filter_value, ())
+        
+        if not filtered_log:
+            log_tree.insert("", "end", values=("", "", "", "", f"No activities found for filter: {filter_value}"), tags=('placeholder',))
+            return
 
-        log_text.config(state='disabled')
+        # Rows are formatted once per entry and reused on every filter change
+        insert = log_tree.insert
+        for entry in filtered_log:
+            insert("", "end", values=entry.get('_row') or self.format_log_entry(entry))
 
-    def refresh_activity_log(self, log_text):
+    def refresh_activity_log(self, log_tree):
         """Refresh the activity log display"""
+        self._flush_config()  # Don't reload over entries that are still waiting to be written
         self.load_activity_log()
-        self.filter_activity_log(log_text)
+        self.filter_activity_log(log_tree)
 
     def clear_activity_log(self):
         """Clear the activity log (admin only)"""
@@ -1926,11 +2433,12 @@ class ModernApp:
             return
         
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to clear the entire activity log? This action cannot be undone."):
-            self.activity_log = []
-            self.save_activity_log()
+            self.activity_log.clear()
+            self._activity_by_action.clear()
+            self.save_activity_log()  # Truncates the file
             self.log_activity("Log Cleared", "Activity log cleared by administrator")
             messagebox.showinfo("Success", "Activity log has been cleared")
-            self.create_activity_log_page()  # Refresh the page
+            self.filter_activity_log(self._activity_log_widget)  # Refresh the table
 
     def create_password_page(self):
         # Deactivate auto fan when navigating to maintenance
@@ -1938,11 +2446,16 @@ class ModernApp:
             print("Deactivating auto fan control due to maintenance navigation")
             self.auto_control_active = False
             
-        if self.current_frame:
-            self.current_frame.destroy()
+        # Reuse the login form if it was already built
+        if self.show_cached_page('password'):
+            self.maint_username_entry.delete(0, tk.END)
+            self.password_entry.delete(0, tk.END)
+            return
+
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
-        self.current_frame.pack(expand=True)
+        self.cache_page('password', expand=True)
 
         # Header
         header_label = tk.Label(
@@ -2044,11 +2557,16 @@ class ModernApp:
             self.password_entry.delete(0, tk.END)
 
     def create_ip_setup_password_page(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        # Reuse the login form if it was already built
+        if self.show_cached_page('ip_setup_password'):
+            self.ip_username_entry.delete(0, tk.END)
+            self.ip_setup_password_entry.delete(0, tk.END)
+            return
+
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
-        self.current_frame.pack(expand=True)
+        self.cache_page('ip_setup_password', expand=True)
 
         # Header
         header_label = tk.Label(
@@ -2163,8 +2681,7 @@ class ModernApp:
         cancel_button.pack(side='left', padx=10, ipady=5)
 
     def create_maintenance_page(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True)
@@ -2328,11 +2845,11 @@ class ModernApp:
                 self.auto_threshold = new_threshold  # Update the auto threshold as well
                 
                 # Save the new threshold to config file for persistence
-                self.save_user_config()
+                self._schedule_config_save(config=True)
                 
                 self.log_activity("Turbo Threshold Changed", f"Changed from {old_threshold}°F to {new_threshold}°F")
                 messagebox.showinfo("Success", f"Turbo temperature threshold set to {new_threshold}°F and saved to memory")
-                self.create_maintenance_page()  # Refresh the page to show new value
+                self.root.after_idle(self.create_maintenance_page)  # Refresh the page to show new value
             else:
                 messagebox.showerror("Invalid Input", "Turbo temperature threshold must be between 950°F and 1050°F")
         except ValueError:
@@ -2348,17 +2865,16 @@ class ModernApp:
         self.maintenance_mode_active = True
         self.log_activity("SP Controls", "SP Controls activated")
         messagebox.showinfo("Success", "SP Controls have been activated!")
-        self.create_maintenance_page()  # Refresh the maintenance page
+        self.root.after_idle(self.create_maintenance_page)  # Refresh the maintenance page
         
     def deactivate_maintenance_mode(self):
         self.maintenance_mode_active = False
         self.log_activity("SP Controls", "SP Controls deactivated")
         messagebox.showinfo("Success", "SP Controls have been deactivated!")
-        self.create_maintenance_page()  # Refresh the maintenance page
+        self.root.after_idle(self.create_maintenance_page)  # Refresh the maintenance page
 
     def create_maintenance_page(self):
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         self.current_frame = tk.Frame(self.root, bg='#1e1e1e')
         self.current_frame.pack(expand=True)
@@ -2517,17 +3033,82 @@ class ModernApp:
         user_mgmt_button.pack(side='left', padx=10, ipady=5)
 
     # [Rest of the methods remain the same as in your provided code]
-    def process_scan_results(self, string_result, int_result, ip):
-        pump_number = ''
-        for reg in string_result.registers:
-            high_byte = (reg >> 8) & 0xFF
-            low_byte = reg & 0xFF
-            if high_byte != 0:
-                pump_number += chr(high_byte)
-            if low_byte != 0:
-                pump_number += chr(low_byte)
-
-        integer_value = int_result.registers[0]
+    async def scan_ip_range(self, ips, done):
+        """
+        Probe each ip for an HMI (runs on the background loop) and create pump files for those that answer
+        done[0] counts finished addresses; _track_scan_progress reads it from the Tk thread
+        """
+        loop = asyncio.get_running_loop()
+        budget = asyncio.Semaphore(_MAX_CONCURRENT_SCANS)
+        # A rescan within _SCAN_POOL_IDLE of the last one reuses its sockets; keep them open for this one
+        if self._scan_pool_expiry is not None:
+            self._scan_pool_expiry.cancel()
+            self._scan_pool_expiry = None
+
+        async def read_ident(ip):
+            # Scan clients have their own pool, so monitor sessions ending in between don't close them.
+            # A scan is the only user of its pool and each probe makes one request, so no lock is needed
+            pool = self.scan_connection_pool
+            key = (ip, _MODBUS_PORT)
+            try:
+                client = await self.get_async_modbus_connection(ip, pool=pool)
+                if client is None or not client.connected:
+                    # Nothing listening - don't keep a pool entry for an empty address
+                    self._drop_async_connection(key, pool.get(key), pool)
+                    return None
+                # Pump name (128..137) and HMI version (138) are contiguous - one request for both
+                return await client.read_holding_registers(address=128, count=11)
+            except BaseException:
+                # Failed or timed out part way: the socket can't be trusted for the next scan
+                self._drop_async_connection(key, pool.get(key), pool)
+                raise
+
+        async def probe(ip):
+            if (ip, _MODBUS_PORT) in self.scan_connection_pool:
+                # A reused socket may have gone half-open since the last scan. Give it half the budget,
+                # then retry once on a fresh connection so the pump isn't left out of the config
+                try:
+                    result = await asyncio.wait_for(read_ident(ip), _SCAN_TIMEOUT / 2)
+                except Exception:
+                    result = await read_ident(ip)  # read_ident already dropped the stale client
+            else:
+                result = await read_ident(ip)
+            if result is not None and not result.isError():
+                # Copying the exe is blocking file I/O, so keep it off the loop
+                await loop.run_in_executor(self._io_pool, self.process_scan_results, result.registers, ip)
+
+        async def scan_one(ip):
+            async with budget:
+                try:
+                    await asyncio.wait_for(probe(ip), _SCAN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass  # Nothing answering at this address
+                except Exception as e:
+                    print(f"Error scanning {ip}: {e}")
+            done[0] += 1  # Only this loop writes it
+
+        try:
+            await asyncio.gather(*(scan_one(ip) for ip in ips))
+        finally:
+            # Don't hold a socket to every HMI until shutdown - close them once no rescan follows
+            self._scan_pool_expiry = loop.call_later(
+                _SCAN_POOL_IDLE, self._close_async_connections, self.scan_connection_pool)
+
+    def _track_scan_progress(self, progress_bar, done, total):
+        """Copy the scan's finished count to progress_bar every _SCAN_PROGRESS_MS until it completes (Tk thread)"""
+        # One redraw per tick however many probes finished in between
+        if not progress_bar.winfo_exists():
+            return
+        progress_bar['value'] = done[0] * 100 / max(total, 1)
+        if done[0] < total:
+            self.root.after(_SCAN_PROGRESS_MS, self._track_scan_progress, progress_bar, done, total)
+
+    def process_scan_results(self, registers, ip):
+        # registers[:10] is the pump name, two chars each (high byte first); registers[10] the HMI version
+        buf = _PUMP_NAME_BE.pack(*registers[:10])
+        pump_number = buf.decode('latin-1').replace('\x00', '')
+
+        integer_value = registers[10]
         self.create_pump_files(pump_number, ip, integer_value)
 
     def create_pump_files(self, pump_number, ip, integer_value):
@@ -2541,43 +3122,46 @@ class ModernApp:
             shutil.copy("PumperHMI.exe", os.path.join(new_folder, f"{pump_number}.exe"))
             self.write_ini_file(new_folder, ip, version=1)
 
+
     def write_ini_file(self, folder, ip, version):
+        template = _INI_V8 if version == 8 else _INI_V1
         with open(os.path.join(folder, "PumperHMI.ini"), 'w') as ini_file:
-            if version == 8:
-                ini_file.write(f"[cRIO]\nIPAddress = \"{ip}\"\n"
-                               f"Webservice Name = WebService\n"
-                               f"Webservice Port = 8002\n\n"
-                               f"[HMI]\nWindow State = Invalid\n")
-            else:
-                ini_file.write(f"[PumperHMI]\n"
-                               f"server.app.propertiesEnabled=True\n"
-                               f"server.ole.enabled=True\n"
-                               f"server.tcp.paranoid=True\n"
-                               f'server.tcp.serviceName="My Computer/VI Server"\n'
-                               f"server.vi.callsEnabled=True\n"
-                               f"server.vi.propertiesEnabled=True\n"
-                               f'WebServer.TcpAccess="c+*"\n'
-                               f'WebServer.ViAccess="+*"\n'
-                               f"DebugServerEnabled=False\n"
-                               f"DebugServerWaitOnLaunch=False\n"
-                               f"blinkFG=00FF0000\n\n"
-                               f"[cRIO]\n"
-                               f"IPAddress = \"{ip}\"\n"
-                               f"Webservice Name = WebService\n"
-                               f"Webservice Port = 8002\n\n"
-                               f"[HMI]\n"
-                               f'Window State="Standard"\n'
-                               f"Resizable?=True\n"
-                               f"TimeZone=-21600\n")
+            ini_file.write(template.format(ip=ip))
 
     def get_exe_files(self):
-        exe_files = []
-        if os.path.exists(self.exe_folder):
-            for root, dirs, files in os.walk(self.exe_folder):
-                for file in files:
-                    if file.endswith('.exe'):
-                        exe_files.append(os.path.join(root, file))
-        return exe_files
+        def scan(path, dirs):
+            # Stat before listing, so a change made during the listing still shows up next time
+            dirs[path] = os.stat(path).st_mtime_ns
+            # scandir's DirEntry carries the file type, so no extra stat() per entry like os.walk
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from scan(entry.path, dirs)
+                    elif entry.name.endswith('.exe') and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+
+        def unchanged(dirs):
+            # Adding or removing an exe changes its own folder's mtime, a new or removed folder its parent's
+            try:
+                return bool(dirs) and all(os.stat(path).st_mtime_ns == mtime for path, mtime in dirs.items())
+            except OSError:
+                return False
+
+        # Reuse the last scan while none of the folders it walked has changed
+        if unchanged(self._exe_cache['dirs']):
+            return self._exe_cache['files']
+
+        dirs = {}
+        try:
+            files = list(scan(self.exe_folder, dirs))
+        except OSError:
+            files = []
+        names = [os.path.basename(path)[:-4] for path in files]
+        # 'choices' is the pump dropdown's value list, shared by every combobox. It lives in the same cache
+        # slot as the listing, so it is rebuilt whenever any folder in the walk changes, not only the root
+        self._exe_cache = {'dirs': dirs, 'files': files, 'choices': ("Select Pump", *names)}
+        self._exe_by_name = dict(zip(names, files))
+        return files
 
     def save_assignments(self):
         try:
@@ -2587,26 +3171,68 @@ class ModernApp:
                     assignments_data[str(pump_index)] = {
                         "exe_name": data['dropdown'].get()
                     }
-            with open('pump_assignments.json', 'w') as f:
-                json.dump(assignments_data, f)
+            # Nothing to write if the assignments match what is already on disk
+            if assignments_data == self._last_saved_assignments:
+                return
+
+            # Write to a temp file and swap it in so a crash can't leave a torn pump_assignments.json
+            tmp_file = 'pump_assignments.json.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(assignments_data, f, separators=(',', ':'))
+            os.replace(tmp_file, 'pump_assignments.json')
+            self._last_saved_assignments = assignments_data
+            # Keep the in-memory copy current instead of re-reading the file
+            self._cache_assignments({int(k): v for k, v in assignments_data.items()})
         except Exception as e:
             print(f"Error saving assignments: {e}")
 
     def load_assignments(self):
+        assignments = {}
         try:
-            if os.path.exists('pump_assignments.json'):
-                with open('pump_assignments.json', 'r') as f:
-                    assignments = json.load(f)
-                    # Convert string keys to integers
-                    return {int(k): {"exe_name": v["exe_name"]} for k, v in assignments.items()}
+            # Convert string keys to integers
+            assignments = {int(k): {"exe_name": v["exe_name"]} for k, v in _load_json('pump_assignments.json').items()}
+            self._last_saved_assignments = {str(k): dict(v) for k, v in assignments.items()}
+        except FileNotFoundError:
+            # No assignments saved yet
+            pass
         except Exception as e:
             print(f"Error loading assignments: {e}")
-        return {}
+        self._cache_assignments(assignments)
+        # Callers attach widgets to the returned dicts, so hand out a copy
+        return {k: dict(v) for k, v in assignments.items()}
+
+    def _cache_assignments(self, assignments):
+        """Store assignments in memory along with the unit name -> pump number map"""
+        self._assignments_cache = assignments
+        # Pump numbers are converted once here rather than on every sort and label
+        self._unit_to_pump_map = {data.get('exe_name'): int(pump_num) for pump_num, data in assignments.items()
+                                  if data.get('exe_name') != 'Select Pump'}
+
+    def get_unit_to_pump_map(self):
+        """Unit name -> assigned pump number, loading assignments from disk only the first time"""
+        if self._unit_to_pump_map is None:
+            self.load_assignments()
+        return self._unit_to_pump_map
+
+    def units_by_pump(self):
+        """Tag self.units_info with pump numbers and return it ordered by pump, unassigned units last"""
+        unit_to_pump_map = self.get_unit_to_pump_map()
+        names = tuple(unit['unit_name'] for unit in self.units_info)
+        cache = self._units_order_cache
+        # The map object is replaced whenever assignments are loaded or saved, so identity is enough
+        if cache is None or cache[0] is not unit_to_pump_map or cache[1] != names:
+            # Stable sort, so unassigned units keep their folder order
+            order = sorted(range(len(names)), key=lambda i: (names[i] not in unit_to_pump_map,
+                                                             unit_to_pump_map.get(names[i], 0)))
+            cache = self._units_order_cache = (unit_to_pump_map, names, order)
+        for unit in self.units_info:
+            unit['pump_number'] = unit_to_pump_map.get(unit['unit_name'])
+        return [self.units_info[i] for i in cache[2]]
 
     def set_pump_assignment(self, pump_index, dropdown):
         selected_exe = dropdown.get()
         if selected_exe != "Select Pump":
-            exe_path = next((file for file in self.exe_files if os.path.basename(file)[:-4] == selected_exe), None)
+            exe_path = self._exe_by_name.get(selected_exe)
             if exe_path:
                 self.run_exe(exe_path)
                 self.save_assignments()
@@ -2614,54 +3240,79 @@ class ModernApp:
             messagebox.showwarning("Invalid Selection", "Please select a pump before setting.")
 
     def run_exe(self, exe_path):
+        """Kill the other HMIs and launch exe_path on the I/O pool so the UI never stalls"""
+        future = self._io_pool.submit(self._do_run_exe, exe_path)
+        future.add_done_callback(lambda f: self._run_exe_done(f, exe_path))
+
+    def _run_exe_done(self, future, exe_path):
+        """Report a failed launch back on the Tk thread"""
+        error = future.exception()
+        if error is not None:
+            print(f"Error starting process: {error}")
+            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to start {os.path.basename(exe_path)}: {error}"))
+
+    def _do_run_exe(self, exe_path):
+        """Worker for run_exe - runs on self._io_pool"""
+        # Names of all exe files except the target (Windows process names are case-insensitive)
+        target_exe = os.path.basename(exe_path)
+        targets = {os.path.basename(exe).lower() for exe in self.exe_files if os.path.basename(exe) != target_exe}
+
+        # One pass over the process table: other HMIs to kill, and whether the target is already up
+        matched = []
+        target_running = False
+        try:
+            for proc in psutil.process_iter(['name']):
+                name = (proc.info['name'] or '').lower()
+                if name in targets:
+                    matched.append(proc)
+                elif name == target_exe.lower():
+                    target_running = True
+        except Exception as e:
+            print(f"Error listing processes: {e}")
+
+        # Re-selecting the HMI that is already the only one running - nothing to kill or launch
+        if target_running and not matched:
+            return
+
         def kill_processes():
             try:
-                # Get list of running processes with their executable names
-                process_list = subprocess.check_output(['tasklist', '/FO', 'CSV', '/NH'],
-                                                       universal_newlines=True).split('\n')
-
-                # Get basenames of all exe files except the target
-                target_exe = os.path.basename(exe_path)
-                exe_basenames = [os.path.basename(exe) for exe in self.exe_files if os.path.basename(exe) != target_exe]
-
-                # Kill each running process that matches our exe files
-                for process in process_list:
-                    if process:  # Skip empty lines
-                        try:
-                            process_name = process.split(',')[0].strip('"')
-                            if process_name in exe_basenames:
-                                subprocess.run(['taskkill', '/F', '/IM', process_name],
-                                               stdout=subprocess.DEVNULL,
-                                               stderr=subprocess.DEVNULL)
-                                time.sleep(0.1)  # Small delay to ensure process is killed
-                        except Exception as e:
-                            print(f"Error killing process {process_name}: {e}")
+                def kill(proc):
+                    try:
+                        proc.kill()
+                    except psutil.NoSuchProcess:
+                        pass
+                    except Exception as e:
+                        print(f"Error killing process {proc.info['name']}: {e}")
+
+                # Kills are independent, so issue them concurrently
+                if matched:
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        list(executor.map(kill, matched))
+
+                # Block until the killed processes have actually exited (returns as soon as they do,
+                # rather than sleeping a fixed interval)
+                gone, alive = psutil.wait_procs(matched, timeout=1.0)
+                for proc in alive:
+                    print(f"Process {proc.info['name']} did not exit within 1 second")
 
             except Exception as e:
                 print(f"Error in kill_processes: {e}")
 
-        try:
-            # Kill existing processes first and wait for completion
-            kill_thread = threading.Thread(target=kill_processes)
-            kill_thread.start()
-            kill_thread.join(timeout=1.0)  # Wait up to 3 seconds for processes to be killed
-
-            # Start new process
-            subprocess.Popen(exe_path)
+        # Kill existing processes first - wait_procs returns once they have exited (1 second cap)
+        kill_processes()
 
-        except Exception as e:
-            print(f"Error starting process: {e}")
+        # Start new process
+        subprocess.Popen(exe_path)
 
 
     def create_monitor_page(self):
         # Track current monitoring state before stopping
         self.was_monitoring_before_navigation = self.monitoring_active
         
-        # Stop any existing monitor threads
+        # Stop any running monitor polling
         self.stop_monitoring()
         
-        if self.current_frame:
-            self.current_frame.destroy()
+        self.release_current_frame()
 
         # Set up the main frame
         self.current_frame = tk.Frame(self.root)
@@ -2723,6 +3374,7 @@ class ModernApp:
         # Create a frame for the units display with modern styling
         self.grid_frame = tk.Frame(self.current_frame, bg='#1e1e1e')
         self.grid_frame.pack(expand=True, fill='both', padx=10, pady=10)
+        self._watch_grid_frame()
         
         # Create monitor displays for each unit
         self.create_unit_monitors()
@@ -2843,248 +3495,165 @@ class ModernApp:
         if self.was_monitoring_before_navigation:
             self.root.after(100, self.start_monitoring)  # Delay to ensure UI is ready
         
+    def _find_unit_folders(self):
+        """Scan the exe folder once and group unit folders by prefix ('230' and 'LFPC')"""
+        result = {'230': [], 'LFPC': []}
+        try:
+            mtime = os.stat(self.exe_folder).st_mtime_ns
+        except OSError:
+            return result
+        # Only the listing is cached on the folder mtime - rewriting an .ini inside a unit folder doesn't
+        # change it, so the IPs always go through read_ip_from_ini, which is keyed on each file's mtime
+        if self._unit_folders_cache is not None and self._unit_folders_cache[0] == mtime:
+            candidates = self._unit_folders_cache[1]
+        else:
+            candidates = []  # (prefix, folder name, folder path)
+            with os.scandir(self.exe_folder) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    for prefix in result:
+                        if entry.name.startswith(prefix):
+                            candidates.append((prefix, entry.name, entry.path))
+                            break
+            self._unit_folders_cache = (mtime, candidates)
+        
+        # Read the .ini files concurrently - file reads release the GIL, which matters on slow/USB drives
+        ip_addresses = self._io_pool.map(self.read_ip_from_ini, [path for _, _, path in candidates])
+        for (prefix, name, path), ip_address in zip(candidates, ip_addresses):
+            if ip_address:
+                result[prefix].append({
+                    'unit_name': name,
+                    'folder_path': path,
+                    'ip_address': ip_address,
+                    'port': _MODBUS_PORT,
+                    'unit_id': 1,  # Modbus unit ID; distinguishes units sharing one gateway ip/port
+                    'last_fan_ts': 0.0  # time.monotonic() of the last auto-control fan command
+                })
+        return result
+    
     def find_230xx_folders(self):
         """Find all folders with names starting with '230' and read their IP addresses from .ini files"""
-        units_info = []
-        
-        if os.path.exists(self.exe_folder):
-            for folder in os.listdir(self.exe_folder):
-                if folder.startswith('230'):
-                    folder_path = os.path.join(self.exe_folder, folder)
-                    
-                    if os.path.isdir(folder_path):
-                        # Try to read IP from .ini file
-                        ip_address = self.read_ip_from_ini(folder_path)
-                        if ip_address:
-                            units_info.append({
-                                'unit_name': folder,
-                                'folder_path': folder_path,
-                                'ip_address': ip_address
-                            })
-        
-        return units_info
+        # Copies, since the monitor pages attach their widgets to these dicts
+        return [dict(unit) for unit in self._find_unit_folders()['230']]
     
     def read_ip_from_ini(self, folder_path):
         """Read IP address from .ini file in the specified folder"""
         ini_path = os.path.join(folder_path, "PumperHMI.ini")
-        if os.path.exists(ini_path):
-            try:
-                config = configparser.ConfigParser()
-                config.read(ini_path)
-                
-                if 'cRIO' in config and 'IPAddress' in config['cRIO']:
-                    # Extract IP address and remove quotes if present
-                    ip = config['cRIO']['IPAddress'].strip('"')
-                    return ip
-                    
-            except Exception as e:
-                print(f"Error reading .ini file {ini_path}: {e}")
-                
-                # Try manual parsing if ConfigParser fails
-                try:
-                    with open(ini_path, 'r') as f:
-                        content = f.read()
-                        match = re.search(r'IPAddress\s*=\s*"([\d\.]+)"', content)
-                        if match:
-                            return match.group(1)
-                except Exception as e:
-                    print(f"Error in manual parsing of {ini_path}: {e}")
-        
-        return None
+        try:
+            # Cached per (path, mtime) - write_ini_file bumps the mtime, so edits are picked up
+            return _read_ip_cached(ini_path, os.stat(ini_path).st_mtime_ns)
+        except OSError:
+            return None
     
     def find_lfpc_folders(self):
         """Find all folders with names starting with 'LFPC' and read their IP addresses from .ini files"""
-        lfpc_units_info = []
-        
-        if os.path.exists(self.exe_folder):
-            for folder in os.listdir(self.exe_folder):
-                if folder.startswith('LFPC'):
-                    folder_path = os.path.join(self.exe_folder, folder)
-                    
-                    if os.path.isdir(folder_path):
-                        # Try to read IP from .ini file
-                        ip_address = self.read_ip_from_ini(folder_path)
-                        if ip_address:
-                            lfpc_units_info.append({
-                                'unit_name': folder,
-                                'folder_path': folder_path,
-                                'ip_address': ip_address,
-                                'unit_type': 'LFPC'
-                            })
-        
-        return lfpc_units_info
+        return [dict(unit, unit_type='LFPC') for unit in self._find_unit_folders()['LFPC']]
     
     def create_unit_monitors(self):
         """Create monitoring displays for each unit"""
-        # Load pump assignments to map pump numbers to unit numbers
-        pump_assignments = self.load_assignments()
-        
-        # Create a mapping of unit numbers to their assigned pump numbers
-        unit_to_pump_map = {}
-        for pump_num, data in pump_assignments.items():
-            if data.get('exe_name') != 'Select Pump':
-                unit_to_pump_map[data.get('exe_name')] = pump_num
-        
-        # Sort units based on their pump assignments
-        sorted_units = []
-        unassigned_units = []
-        
-        for unit in self.units_info:
-            unit_name = unit['unit_name']
-            if unit_name in unit_to_pump_map.keys():
-                # Add pump number to unit info
-                unit['pump_number'] = unit_to_pump_map[unit_name]
-                sorted_units.append(unit)
-            else:
-                # Unit not assigned to any pump
-                unit['pump_number'] = None
-                unassigned_units.append(unit)
-        
-        # Sort units by pump number
-        sorted_units.sort(key=lambda u: int(u['pump_number']))
-        
-        # Add unassigned units at the end
-        all_units = sorted_units + unassigned_units
+        # Units ordered by pump assignment, unassigned units at the end
+        all_units = self.units_by_pump()
         
         # Calculate rows and columns (5 rows per column)
         rows_per_column = 6
         num_units = len(all_units)
         num_columns = (num_units + rows_per_column - 1) // rows_per_column
         
+        # One canvas draws every tile - text and rectangles are canvas items instead of ~10 widgets per unit.
+        # Only the interactive controls (Fan/HMI/Set buttons and the SP entry) are real widgets.
+        canvas = tk.Canvas(
+            self.grid_frame,
+            bg='#1e1e1e',
+            highlightthickness=0,
+            width=num_columns * (_TILE_WIDTH + 10),
+            height=min(num_units, rows_per_column) * (_TILE_HEIGHT + 10)
+        )
+        canvas.pack(expand=True, fill='both')
+        sp_controls = self.maintenance_mode_active or self.master_maintenance_mode
+        
         for i, unit in enumerate(all_units):
             # Calculate position (column first, then row)
             col = i // rows_per_column
             row = i % rows_per_column
+            x = 5 + col * (_TILE_WIDTH + 10)
+            y = 5 + row * (_TILE_HEIGHT + 10)
+            tag = f"unit_{unit['unit_name']}"
             
-            # Create a frame for this unit (50% smaller)
-            unit_frame = tk.Frame(self.grid_frame, bg='#2d2d2d', padx=7, pady=7, bd=1, relief='solid', width=175, height=150)
-            unit_frame.grid(row=row, column=col, padx=5, pady=5, sticky='nsew')
-            unit_frame.grid_propagate(False)  # Force the frame to maintain its size
-            
-            # Unit header with name and IP
-            header = tk.Frame(unit_frame, bg='#2d2d2d')
-            header.pack(fill='x')
+            # Tile border
+            canvas.create_rectangle(x, y, x + _TILE_WIDTH, y + _TILE_HEIGHT, fill='#2d2d2d', outline='#555555', tags=tag)
             
             # Display format: "Pump # - Unit ###" if pump number exists
             # Add 1 to pump_number for display (so pump 0 shows as Pump 1)
             if unit['pump_number'] is not None:
-                displayed_pump_num = int(unit['pump_number']) + 1
+                displayed_pump_num = unit['pump_number'] + 1
                 label_text = f"Pump {displayed_pump_num} - Unit {unit['unit_name']}"
             else:
                 label_text = f"Unit {unit['unit_name']}"
-                
-            unit_label = tk.Label(
-                header,
-                text=label_text,
-                font=("Segoe UI", 10, "bold"),
-                bg='#2d2d2d',
-                fg='white'
-            )
-            unit_label.pack(side='left')
-            
-            ip_label = tk.Label(
-                header,
-                text=f"IP: {unit['ip_address']}",
-                font=("Segoe UI", 8),
-                bg='#2d2d2d',
-                fg='#aaaaaa'
-            )
-            ip_label.pack(side='right')
-            
-            # Separator
-            separator = ttk.Separator(unit_frame, orient='horizontal')
-            separator.pack(fill='x', pady=5)
             
-            # Status indicators frame
-            indicators_frame = tk.Frame(unit_frame, bg='#2d2d2d')
-            indicators_frame.pack(fill='x', pady=2)
+            # Unit header with name and IP, then a separator line
+            canvas.create_text(x + 8, y + 16, text=label_text, font=("Segoe UI", 10, "bold"), fill='white', anchor='w', tags=tag)
+            canvas.create_text(x + _TILE_WIDTH - 8, y + 16, text=f"IP: {unit['ip_address']}",
+                               font=("Segoe UI", 8), fill='#aaaaaa', anchor='e', tags=tag)
+            canvas.create_line(x + 8, y + 32, x + _TILE_WIDTH - 8, y + 32, fill='#555555', tags=tag)
             
-            # Turbo Temp display
-            turbo_frame = tk.Frame(indicators_frame, bg='#2d2d2d')
-            turbo_frame.pack(side='left', padx=5)
+            # Turbo Temp display with its digital readout
+            row1 = y + 53
+            canvas.create_text(x + 12, row1, text="Turbo:", tags=tag, **_LBL_STYLE)
+            turbo_box = canvas.create_rectangle(x + 55, row1 - 10, x + 95, row1 + 10, tags=tag, **_VALUE_BOX_STYLE)
+            turbo_text = canvas.create_text(x + 75, row1, text="---", tags=tag, **_VALUE_STYLE)
+            turbo_value = CanvasField(canvas, turbo_text, turbo_box)
             
-            turbo_label = tk.Label(
-                turbo_frame,
-                text="Turbo:",
-                font=("Segoe UI", 8),
-                bg='#2d2d2d',
-                fg='white'
-            )
-            turbo_label.pack(side='left')
+            # Combined status indicator (including PLC status)
+            canvas.create_text(x + 108, row1, text="Status:", tags=tag, **_LBL_STYLE)
+            status_box = canvas.create_rectangle(x + 150, row1 - 8, x + 168, row1 + 8, fill='gray', outline='#aaaaaa', tags=tag)
+            status_light = CanvasField(canvas, box_item=status_box)
             
-            # Digital display for Turbo Temp
-            turbo_value = tk.Label(
-                turbo_frame,
-                text="---",
-                font=("Segoe UI", 9, "bold"),
+            # Control button for register 401000
+            control_button = HoverButton(
+                canvas,
+                text="Fan",
                 width=4,
-                bg='#1e1e1e',
-                fg='#00ff00',
-                relief='sunken',
-                bd=1
-            )
-            turbo_value.pack(side='left', padx=5)
-            
-            # Battery % display - new row below Turbo Temp
-            battery_frame = tk.Frame(unit_frame, bg='#2d2d2d')
-            battery_frame.pack(fill='x', pady=2)
-            
-            battery_label = tk.Label(
-                battery_frame,
-                text="Batt%:",
-                font=("Segoe UI", 8),
-                bg='#2d2d2d',
-                fg='white'
+                font=("Segoe UI", 9),
+                bg='#0078d4',  # Default blue color
+                fg='white',
+                relief="raised",
+                hover_color='#2b88d8',
+                command=lambda u=unit: self.toggle_control(u)
             )
-            battery_label.pack(side='left', padx=5)
+            canvas.create_window(x + _TILE_WIDTH - 58, row1, window=control_button, anchor='e', tags=tag)
             
-            # Digital display for Battery %
-            battery_value = tk.Label(
-                battery_frame,
-                text="---",
-                font=("Segoe UI", 11, "bold"),  # Consistent bold font
+            # HMI button to launch the unit's HMI interface
+            hmi_button = HoverButton(
+                canvas,
+                text="HMI",
                 width=4,
-                bg='#1e1e1e',
-                fg='#00ff00',
-                relief='sunken',
-                bd=1
+                font=("Segoe UI", 9),
+                bg='#107c10',
+                fg='white',
+                relief="raised",
+                hover_color='green',
+                command=lambda u=unit: self.launch_unit_hmi(u)
             )
-            battery_value.pack(side='left', padx=5)
+            canvas.create_window(x + _TILE_WIDTH - 8, row1, window=hmi_button, anchor='e', tags=tag)
+            
+            # Battery % display - row below Turbo Temp
+            row2 = y + 88
+            canvas.create_text(x + 12, row2, text="Batt%:", tags=tag, **_LBL_STYLE)
+            battery_box = canvas.create_rectangle(x + 55, row2 - 12, x + 100, row2 + 12, tags=tag, **_VALUE_BOX_STYLE)
+            battery_text = canvas.create_text(x + 77, row2, text="---", tags=tag, **_BATTERY_VALUE_STYLE)
+            battery_value = CanvasField(canvas, battery_text, battery_box)
             
             # SP Controls - visible when maintenance mode is active OR master maintenance mode is active
-            if self.maintenance_mode_active or self.master_maintenance_mode:
+            if sp_controls:
                 # Set Point display for register 401212
-                setpoint_label = tk.Label(
-                    battery_frame,
-                    text="current SP:",
-                    font=("Segoe UI", 8),
-                    bg='#2d2d2d',
-                    fg='white'
-                )
-                setpoint_label.pack(side='left', padx=5)
-                
-                # Digital display for Set Point
-                setpoint_value = tk.Label(
-                    battery_frame,
-                    text="---",
-                    font=("Segoe UI", 9, "bold"),
-                    width=3,
-                    bg='#1e1e1e',
-                    fg='#00ff00',
-                    relief='sunken',
-                    bd=1
-                )
-                setpoint_value.pack(side='left', padx=5)
+                canvas.create_text(x + 110, row2, text="current SP:", tags=tag, **_LBL_STYLE)
+                setpoint_box = canvas.create_rectangle(x + 172, row2 - 10, x + 202, row2 + 10, tags=tag, **_VALUE_BOX_STYLE)
+                setpoint_text = canvas.create_text(x + 187, row2, text="---", tags=tag, **_VALUE_STYLE)
+                setpoint_value = CanvasField(canvas, setpoint_text, setpoint_box)
                 
                 # Input box for register 401212
-                value_label = tk.Label(
-                    battery_frame,
-                    text="SP:",
-                    font=("Segoe UI", 8),
-                    bg='#2d2d2d',
-                    fg='white'
-                )
-                value_label.pack(side='left', padx=5)
+                canvas.create_text(x + 210, row2, text="SP:", tags=tag, **_LBL_STYLE)
                 
                 # Create a StringVar for the input value
                 input_var = tk.StringVar()
@@ -3092,7 +3661,7 @@ class ModernApp:
                 
                 # Input entry for value (width=3 for up to 3 digits - max 100)
                 value_entry = tk.Entry(
-                    battery_frame,
+                    canvas,
                     textvariable=input_var,
                     font=("Segoe UI", 9),
                     width=3,
@@ -3101,11 +3670,11 @@ class ModernApp:
                     relief='sunken',
                     bd=1
                 )
-                value_entry.pack(side='left', padx=2)
+                canvas.create_window(x + 232, row2, window=value_entry, anchor='w', tags=tag)
                 
                 # Send button for the value
                 send_button = HoverButton(
-                    battery_frame,
+                    canvas,
                     text="Set",
                     width=4,
                     font=("Segoe UI", 9),
@@ -3115,73 +3684,14 @@ class ModernApp:
                     hover_color='#4d0000',
                     command=lambda u=unit, v=input_var: self.send_register_value(u, v, 1212)
                 )
-                send_button.pack(side='left', padx=2)
+                canvas.create_window(x + _TILE_WIDTH - 8, row2, window=send_button, anchor='e', tags=tag)
             else:
                 # Add setpoint_value as None when maintenance mode is inactive
                 setpoint_value = None
                 input_var = None
                 value_entry = None
             
-            # Combined status indicator (including PLC status)
-            status_frame = tk.Frame(indicators_frame, bg='#2d2d2d')
-            status_frame.pack(side='left', padx=5)
-            
-            status_indicator = tk.Label(
-                status_frame,
-                text="Status:",
-                font=("Segoe UI", 8),
-                bg='#2d2d2d',
-                fg='white'
-            )
-            status_indicator.pack(side='left')
-            
-            # Indicator light
-            status_light = tk.Label(
-                status_frame,
-                text="",
-                width=2,
-                height=1,
-                bg='gray',
-                relief='raised',
-                bd=1
-            )
-            status_light.pack(side='left', padx=5)
-            
-            # Remove fan indicator - no longer needed
-            
-            # Button container frame for control and HMI buttons
-            buttons_frame = tk.Frame(indicators_frame, bg='#2d2d2d')
-            buttons_frame.pack(side='right', padx=5)
-            
-            # Control button for register 401000
-            control_button = HoverButton(
-                buttons_frame,
-                text="Fan",
-                width=4,
-                font=("Segoe UI", 9),
-                bg='#0078d4',  # Default blue color
-                fg='white',
-                relief="raised",
-                hover_color='#2b88d8',
-                command=lambda u=unit: self.toggle_control(u)
-            )
-            control_button.pack(side='left', padx=2)
-            
-            # HMI button to launch the unit's HMI interface
-            hmi_button = HoverButton(
-                buttons_frame,
-                text="HMI",
-                width=4,
-                font=("Segoe UI", 9),
-                bg='#107c10',
-                fg='white',
-                relief="raised",
-                hover_color='green',
-                command=lambda u=unit: self.launch_unit_hmi(u)
-            )
-            hmi_button.pack(side='right', padx=2)
-            
-            # Store the widgets in the unit info for updates
+            # Store the item handles in the unit info for updates
             unit['widgets'] = {
                 'turbo_value': turbo_value,
                 'battery_value': battery_value,
@@ -3205,27 +3715,98 @@ class ModernApp:
         
         # Selective polling - only monitor units that are currently visible
         # For monitor page, all units in self.units_info are visible
-        self.visible_units = self.units_info.copy()
-        
-        for unit in self.visible_units:
-            thread = threading.Thread(
-                target=self.monitor_unit,
-                args=(unit,),
-                daemon=True
-            )
+        # LFPC units have no turbo temp, battery % or setpoint, so their static N/A display
+        # is drawn once here and they are left out of the poll cycles
+        self.visible_units = []
+        for unit in self.units_info:
+            if unit.get('unit_type') == 'LFPC':
+                widgets = unit['widgets']
+                lfpc_display = {'turbo_value': {'text': "N/A"}, 'battery_value': {'text': "N/A"},
+                                'status_light': {'bg': 'gray'}, 'control_button': {'bg': 'gray'}}
+                if widgets['setpoint_value'] is not None:
+                    lfpc_display['setpoint_value'] = {'text': "N/A"}
+                self._apply_updates(widgets, lfpc_display)
+            else:
+                self.visible_units.append(unit)
+
+        # One event loop thread polls every unit concurrently instead of a thread per unit
+        # Cycles run at the fast-tier rate; monitor_unit decides which register tiers are due
+        self._start_monitor_cycles(self.monitor_unit, _FAST_POLL_INTERVAL)
+    
+    def get_event_loop(self):
+        """Start the background asyncio loop on first use and return it"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._loop.run_forever, daemon=True)
             thread.start()
-            self.monitor_threads.append(thread)
+        return self._loop
+    
+    def _start_monitor_cycles(self, poll_unit, interval):
+        """Schedule run_monitor_cycles on the background loop along with its stop event"""
+        loop = self.get_event_loop()
+        # The event exists before the coroutine is scheduled, so stop_monitoring always has this session's
+        # event to set - even if it runs before the coroutine has started. An Event binds to a loop only on
+        # first wait, so it can be made here on the Tk thread
+        stop = self._stop_event = asyncio.Event()
+        previous = self._monitor_future
+        self._monitor_future = asyncio.run_coroutine_threadsafe(
+            self.run_monitor_cycles(poll_unit, interval, stop, previous), loop)
+    
+    async def run_monitor_cycles(self, poll_unit, interval, stop, previous=None):
+        """Start one poll per visible unit every interval until monitoring stops or stop is set"""
+        if previous is not None:
+            # The last session closes the shared async pool on its way out - let it finish before dialling
+            await asyncio.gather(asyncio.wrap_future(previous), return_exceptions=True)
+        in_flight = {}  # unit name -> Task of its last poll
+        loop = asyncio.get_running_loop()
+        budget = asyncio.Semaphore(_MAX_CONCURRENT_POLLS)
+
+        async def bounded_poll(unit):
+            # Caps open requests (and sockets being dialled) however many units are on screen
+            async with budget:
+                await poll_unit(unit)
+
+        # Cycles are anchored to a fixed monotonic schedule so wake-up latency doesn't accumulate as drift
+        next_cycle = loop.time()
+        try:
+            while self.monitoring_active and not stop.is_set():
+                for unit in self.visible_units:
+                    # A unit whose previous poll is still running (e.g. timing out) is skipped this cycle
+                    task = in_flight.get(unit['unit_name'])
+                    if task is None or task.done():
+                        in_flight[unit['unit_name']] = asyncio.create_task(bounded_poll(unit))
+                next_cycle += interval
+                now = loop.time()
+                if next_cycle < now:
+                    # Fell behind (e.g. the machine was suspended) - skip the missed cycles instead of bursting
+                    next_cycle = now
+                # Wait out the rest of the cycle, but wake immediately when stop_monitoring signals
+                try:
+                    await asyncio.wait_for(stop.wait(), next_cycle - now)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in in_flight.values():
+                task.cancel()
+            await asyncio.gather(*in_flight.values(), return_exceptions=True)
+            self._close_async_connections()
     
     def stop_monitoring(self):
-        """Stop all monitoring threads"""
+        """Stop the polling coroutine on the event loop and close every Modbus connection"""
+        # The flash timer is cancelled even when monitoring already stopped, so it can't outlive a session
+        if self._flash_job is not None:
+            self.root.after_cancel(self._flash_job)
+            self._flash_job = None
+        
         if not self.monitoring_active:
             # Already stopped
             return
             
-        # Set the flag to signal threads to exit their loops
+        # Clear the flag so no new polls start
         self.monitoring_active = False
         
-        print("Stopping all monitoring threads...")
+        print("Stopping monitoring...")
         
         # Only try to update buttons if they still exist in the widget hierarchy
         try:
@@ -3237,185 +3818,167 @@ class ModernApp:
             # Button was destroyed or doesn't exist anymore
             pass
         
-        # Wait for threads to terminate with a reasonable timeout
-        active_threads = []
-        for thread in self.monitor_threads:
-            if thread.is_alive():
-                thread.join(1.5)  # Wait longer (1500ms) for each thread to terminate
-                if thread.is_alive():
-                    active_threads.append(thread)
-        
-        # Log any threads that didn't terminate in time
-        if active_threads:
-            print(f"Warning: {len(active_threads)} monitoring threads did not terminate properly")
-                
-        self.monitor_threads = []
+        # Wake the polling coroutine so it exits at once; it cancels in-flight reads and closes its clients
+        # on the way out. Nothing waits for that here - the next session's coroutine does, on the loop
+        if self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+            self._stop_event = None
         
         # Close all Modbus connections to reduce load on cRIO
         self.close_all_connections()
     
-    def monitor_unit(self, unit):
-        """Monitor Modbus registers for a specific unit"""
+    async def read_registers(self, read, addresses, slave, lock):
+        """Read addresses with the coalesced request plan and return address -> value (failed spans are left out)"""
+        values = {}
+        for start, count in _plan_reads(addresses):
+            # Gateways often can't pipeline, so only one request is outstanding per socket
+            async with lock:
+                result = await read(address=start, count=count, slave=slave)
+            if not result.isError():
+                for address in addresses:
+                    if start <= address < start + count:
+                        values[address] = result.registers[address - start]
+        return values
+    
+    async def monitor_unit(self, unit):
+        """Poll Modbus registers once for a specific unit (scheduled by run_monitor_cycles)"""
+        if not self.monitoring_active:
+            return
         ip = unit['ip_address']
         unit_name = unit.get('unit_name', 'Unknown')
-        is_lfpc = unit.get('unit_type') == 'LFPC'
-        print(f"Starting monitoring thread for unit {unit_name} at {ip}")
+        
+        port = unit.get('port', _MODBUS_PORT)
+        slave = unit.get('unit_id', 1)
+        lock = self.async_connection_locks[(ip, port)]
         
         try:
             widgets = unit['widgets']
-            flash_counter = 0
+            has_setpoint = widgets['setpoint_value'] is not None  # SP controls only exist on some tiles
+            # Widget key -> config options; applied in one Tk callback at the end of the poll
+            pending = {}
             
-            while self.monitoring_active:
-                # Exit if monitoring has been deactivated
-                if not self.monitoring_active:
-                    print(f"Monitoring deactivated for unit {unit_name}, exiting thread")
-                    break
-                
-                # Use connection pooling for better performance
-                client = self.get_modbus_connection(ip)
-                
-                try:
-                    if client:
-                        if is_lfpc:
-                            # LFPC unit maintenance monitoring - only monitor the 4 specified channels
-                            # LFPC units don't have turbo temp, battery %, or setpoint controls
-                            # Set displays to show "N/A" for non-applicable parameters
-                            self.root.after(0, lambda w=widgets['turbo_value']: self.safe_widget_update(w, text="N/A"))
-                            self.root.after(0, lambda w=widgets['battery_value']: self.safe_widget_update(w, text="N/A"))
-                            if widgets['setpoint_value'] is not None:
-                                self.root.after(0, lambda w=widgets['setpoint_value']: self.safe_widget_update(w, text="N/A"))
-                            # Set status light to gray for LFPC (not applicable)
-                            self.root.after(0, lambda w=widgets['status_light']: self.safe_widget_update(w, bg='gray'))
-                            # Set control button to gray for LFPC (not applicable)
-                            self.root.after(0, lambda w=widgets['control_button']: self.safe_widget_update(w, bg='gray'))
-                        else:
-                            # 230xx unit maintenance monitoring - use batch reading to reduce requests
-                            # Batch read: Turbo Temp (302075) and Battery % (302027)
-                            # Since addresses are far apart, read them separately but efficiently
-                            
-                            # Read Turbo Temp (address: 302075)
-                            turbo_result = client.read_input_registers(address=2075, count=1)
-                            turbo_temp = 0
-                            if not turbo_result.isError():
-                                turbo_temp = turbo_result.registers[0]
-                                self.root.after(0, lambda w=widgets['turbo_value'], v=turbo_temp: self.safe_widget_update(w, text=f"{v}"))
-                            
-                            # Read Battery % (address: 302027)
-                            battery_result = client.read_input_registers(address=2027, count=1)
-                            if not battery_result.isError():
-                                battery_value = battery_result.registers[0]
-                                
-                                # Check if battery is low (below 50%)
-                                if battery_value < 50:
-                                    # Flash red for low battery warning
-                                    flash_counter = (flash_counter + 1) % 4
-                                    if flash_counter < 2:  # Alternate every 2 cycles
-                                        # Red text on dark background for warning
-                                        self.root.after(0, lambda w=widgets['battery_value'], v=battery_value: 
-                                                       self.safe_widget_update(w, text=f"{v}", fg="red"))
-                                    else:
-                                        # Normal text
-                                        self.root.after(0, lambda w=widgets['battery_value'], v=battery_value: 
-                                                       self.safe_widget_update(w, text=f"{v}", fg="white"))
-                                else:
-                                    # Normal display for healthy battery
-                                    self.root.after(0, lambda w=widgets['battery_value'], v=battery_value: 
-                                                   self.safe_widget_update(w, text=f"{v}", fg="white"))
-                                
-                            # Read current value from register 401212 (only if maintenance mode or master maintenance mode is active)
-                            if (self.maintenance_mode_active or self.master_maintenance_mode) and widgets['setpoint_value'] is not None:
-                                setting_result = client.read_holding_registers(address=1212, count=1)
-                                if not setting_result.isError():
-                                    current_setting = setting_result.registers[0]
-                                    # Update the setpoint display with current value
-                                    self.root.after(0, lambda w=widgets['setpoint_value'], v=current_setting: self.safe_widget_update(w, text=f"{v}"))
-                            
-                        # Auto-control and status logic only for 230xx units
-                        if not is_lfpc:
-                            # Check for auto-control trigger condition - activate fan if turbo temp >= turbo_temp_threshold
-                            if self.auto_control_active and turbo_temp >= self.turbo_temp_threshold:
-                                # Check if enough time has passed since last fan activation for this unit
-                                current_time = time.time()
-                                last_activation = self.last_fan_activation.get(ip, 0)
-                                
-                                # Only send fan command if 10 seconds have passed since last activation
-                                if current_time - last_activation >= 10.0:
-                                    print(f"Auto-control triggered: Fan activation for {unit_name} - Turbo temp: {turbo_temp}")
-                                    # Trigger the fan button (send 100 to register 401000)
-                                    register_address = 1000 # Address for 401000
-                                    
-                                    # Send 100 to register 401000 when temp threshold is reached
-                                    fan_result = client.write_register(address=register_address, value=100)
-                                    if not fan_result.isError():
-                                        print(f"Successfully activated fan for {unit_name} due to high temperature ({turbo_temp})")
-                                        # Update the last activation time for this unit
-                                        self.last_fan_activation[ip] = current_time
-                                    else:
-                                        print(f"Error activating fan for {unit_name}: {fan_result}")
-                                else:
-                                    # Still above threshold but within 10-second cooldown
-                                    remaining_time = 10.0 - (current_time - last_activation)
-                                    print(f"Auto-control cooldown for {unit_name}: {remaining_time:.1f}s remaining (Temp: {turbo_temp})")
-                            
-                            # Read and update combined status indicator
-                            # Check 300005.02 (bit 2 of register 5)
-                            plc_result = client.read_input_registers(address=5, count=1)
-                            plc_bit_set = False
-                            
-                            if not plc_result.isError():
-                                plc_bit_set = bool(plc_result.registers[0] & 0x04)  # Check bit 2
+            # Use connection pooling for better performance - units behind one gateway share the socket
+            client = await self.get_async_modbus_connection(ip, port)
+            
+            try:
+                if client:
+                    # 230xx unit maintenance monitoring - work out which register tiers are due
+                    now = time.monotonic()
+                    next_due = unit.setdefault('next_due', {'fast': now, 'slow': now})
+                    fast = next_due['fast'] <= now
+                    slow = next_due['slow'] <= now
+                    # Deadlines fall half a cycle early so a poll started a little late by the cycle
+                    # scheduler doesn't push the tier past the next cycle and skip it
+                    if fast:
+                        next_due['fast'] = now + _FAST_POLL_INTERVAL / 2
+                    if slow:
+                        next_due['slow'] = now + _SLOW_POLL_INTERVAL - _FAST_POLL_INTERVAL / 2
+                    # Flash phase comes from the clock, so every flashing widget shares one steady period
+                    flash_on = (int(now / _FLASH_HALF_PERIOD) & 1) == 0
+                    show_setpoint = has_setpoint and (self.maintenance_mode_active or self.master_maintenance_mode)
+                    
+                    # Registers for the due tiers are fetched up front, adjacent ones coalesced into
+                    # as few requests as the 125-register limit allows
+                    input_addresses = (_FAST_INPUT_REGISTERS if fast else ()) + (_SLOW_INPUT_REGISTERS if slow else ())
+                    holding_addresses = ((_FAST_HOLDING_REGISTERS if fast else ())
+                                         + (_SLOW_HOLDING_REGISTERS if slow and show_setpoint else ()))
+                    inputs = await self.read_registers(client.read_input_registers, input_addresses, slave, lock)
+                    holdings = await self.read_registers(client.read_holding_registers, holding_addresses, slave, lock)
+                    
+                    # Turbo Temp (302075)
+                    turbo_temp = inputs.get(2075, 0)
+                    if 2075 in inputs:
+                        pending['turbo_value'] = {'text': str(turbo_temp)}
+                    
+                    # Battery % (302027) - read on the slow tier, but redrawn every poll from the last
+                    # reading so the low-battery flash keeps the clock's rhythm
+                    if 2027 in inputs:
+                        unit['battery_level'] = inputs[2027]
+                    battery_value = unit.get('battery_level')
+                    if battery_value is not None:
+                        # Low battery (below 50%) flashes red text; a healthy battery stays white
+                        low_flash = battery_value < 50 and flash_on
+                        pending['battery_value'] = {'text': str(battery_value), 'fg': "red" if low_flash else "white"}
+                        
+                    # Current value of register 401212 (only read if maintenance mode or master maintenance mode is active)
+                    if show_setpoint and 1212 in holdings:
+                        # Update the setpoint display with current value
+                        pending['setpoint_value'] = {'text': str(holdings[1212])}
+                    
+                    # Check for auto-control trigger condition - activate fan if turbo temp >= turbo_temp_threshold
+                    # (only on polls that actually read the turbo temp)
+                    if self.auto_control_active and 2075 in inputs and turbo_temp >= self.turbo_temp_threshold:
+                        # Check if enough time has passed since last fan activation for this unit
+                        # Monotonic, so a wall-clock adjustment can't stretch or skip the cooldown
+                        current_time = time.monotonic()
+                        last_activation = unit['last_fan_ts']
+                        
+                        # Only send fan command if 10 seconds have passed since last activation
+                        if current_time - last_activation >= 10.0:
+                            print(f"Auto-control triggered: Fan activation for {unit_name} - Turbo temp: {turbo_temp}")
+                            # Trigger the fan button (send 100 to register 401000)
+                            register_address = 1000 # Address for 401000
                             
-                            # Update the combined status indicator
-                            if plc_bit_set:
-                                # PLC bit is set - flash between red and green
-                                flash_counter = (flash_counter + 1) % 4
-                                if flash_counter < 2:  # Alternate every 2 cycles
-                                    self.root.after(0, lambda w=widgets['status_light']: self.safe_widget_update(w, bg='red'))
-                                else:
-                                    self.root.after(0, lambda w=widgets['status_light']: self.safe_widget_update(w, bg='green'))
+                            # Send 100 to register 401000 when temp threshold is reached
+                            async with lock:
+                                fan_result = await client.write_register(address=register_address, value=100, slave=slave)
+                            if not fan_result.isError():
+                                print(f"Successfully activated fan for {unit_name} due to high temperature ({turbo_temp})")
+                                # Update the last activation time for this unit
+                                unit['last_fan_ts'] = current_time
                             else:
-                                # No issues - show steady green
-                                self.root.after(0, lambda w=widgets['status_light']: self.safe_widget_update(w, bg='green'))
-
-                            # Read control value from holding register 401000 (address 1000)
-                            response = client.read_holding_registers(address=1000, count=1)
-                            if not response.isError():
-                                control_value = response.registers[0]
-                                # For register 401000: value 100 = ON, make fan button flash red
-                                if control_value == 100:
-                                    # Flash the fan button red when 401000 = 100
-                                    flash_counter = (flash_counter + 1) % 4
-                                    if flash_counter < 2:  # Alternate every 2 cycles
-                                        self.root.after(0, lambda w=widgets['control_button']: self.safe_widget_update(w, bg='red'))
-                                    else:
-                                        self.root.after(0, lambda w=widgets['control_button']: self.safe_widget_update(w, bg='#d83b01'))  # Darker red
-                                else:
-                                    # Normal blue color when 401000 = 0
-                                    self.root.after(0, lambda w=widgets['control_button']: self.safe_widget_update(w, bg='#0078d4'))
-                except Exception as e:
-                    print(f"Error in monitor loop for {unit_name}: {e}")
-                    # Reset displays on error
-                    self.root.after(0, lambda w=widgets['turbo_value']: self.safe_widget_update(w, text="---"))
-                    self.root.after(0, lambda w=widgets['battery_value']: self.safe_widget_update(w, text="---"))
-                    if widgets['setpoint_value'] is not None:
-                        self.root.after(0, lambda w=widgets['setpoint_value']: self.safe_widget_update(w, text="---"))
-                    self.root.after(0, lambda w=widgets['status_light']: self.safe_widget_update(w, bg='gray'))
-                    # Reset fan button color on error
-                    self.root.after(0, lambda w=widgets['control_button']: self.safe_widget_update(w, bg='#0078d4'))
-                finally:
-                    # Connection pooling - don't close client, it will be reused
-                    pass
-
-                # Check again if monitoring is still active before sleeping
-                if not self.monitoring_active:
-                    print(f"Monitoring deactivated for {unit_name} during iteration, exiting")
-                    break
+                                print(f"Error activating fan for {unit_name}: {fan_result}")
+                        else:
+                            # Still above threshold but within 10-second cooldown
+                            remaining_time = 10.0 - (current_time - last_activation)
+                            print(f"Auto-control cooldown for {unit_name}: {remaining_time:.1f}s remaining (Temp: {turbo_temp})")
                     
-                # Sleep between polling cycles - 1500ms update rate
-                time.sleep(1.5)  # Exactly 1500ms
+                    # Update combined status indicator (fast tier)
+                    # Check 300005.02 (bit 2 of register 5)
+                    if fast:
+                        # Bit 2 comes out of the batched input read; the masked int is already truthy
+                        plc_bit_set = inputs.get(5, 0) & 0x04
+                        
+                        # Update the combined status indicator
+                        if plc_bit_set:
+                            # PLC bit is set - flash between red and green
+                            pending['status_light'] = {'bg': 'red' if flash_on else 'green'}
+                        else:
+                            # No issues - show steady green
+                            pending['status_light'] = {'bg': 'green'}
+
+                    # Control value from holding register 401000 (address 1000)
+                    if 1000 in holdings:
+                        # For register 401000: value 100 = ON, make fan button flash red
+                        ctrl_on = holdings[1000] == 100
+                        if ctrl_on:
+                            # Flash the fan button red when 401000 = 100 (darker red on the off phase)
+                            pending['control_button'] = {'bg': 'red' if flash_on else '#d83b01'}
+                        else:
+                            # Normal blue color when 401000 = 0
+                            pending['control_button'] = {'bg': '#0078d4'}
+            except Exception as e:
+                print(f"Error in monitor loop for {unit_name}: {e}")
+                # The socket may be half-dead after a failed request; reconnect on the next poll
+                self._drop_async_connection((ip, port), client)
+                # Reset displays on error
+                pending['turbo_value'] = {'text': "---"}
+                pending['battery_value'] = {'text': "---"}
+                if has_setpoint:
+                    pending['setpoint_value'] = {'text': "---"}
+                pending['status_light'] = {'bg': 'gray'}
+                # Reset fan button color on error
+                pending['control_button'] = {'bg': '#0078d4'}
+            finally:
+                # Merged into the next flush instead of one Tk event per widget, and nothing when nothing changed
+                # Nothing to draw on once the page's widgets are gone
+                if self._widgets_alive:
+                    pending = self._changed_updates(unit, widgets, pending)
+                    if pending:
+                        self._queue_updates(widgets, pending)
 
         except Exception as e:
-            print(f"Error in monitor thread for {unit['unit_name']}: {e}")
+            print(f"Error in monitor poll for {unit['unit_name']}: {e}")
 
     
     def toggle_auto_control(self):
@@ -3438,22 +4001,25 @@ class ModernApp:
     def toggle_control(self, unit):
         """Send value 100 to the control register (401000)"""
         ip = unit['ip_address']
-        client = ModbusTcpClient(ip)
+        port = unit.get('port', _MODBUS_PORT)
         
-        try:
+        # Reuse the pooled connection - no new TCP handshake per click
+        with self.connection_locks[(ip, port)]:
+            client = self.get_modbus_connection(ip, port)
+            if client is None:
+                print(f"Failed to connect to {unit['unit_name']} at {ip}")
+                return
+            
             # Address 401000 (subtract 400000 for Modbus register address)
             register_address = 1000  # Register address for 401000
             
             # Always send 100 to the register
-            result = client.write_register(address=register_address, value=100)
+            result = client.write_register(address=register_address, value=100, slave=unit.get('unit_id', 1))
             
             if result.isError():
                 print(f"Error writing to register 401000 for {unit['unit_name']}: {result}")
             else:
                 print(f"Successfully sent value 100 to register 401000 for {unit['unit_name']}")
-                
-        finally:
-            client.close()
     
     def send_register_value(self, unit, value_var, register_offset):
         """Send the value from an input field to the specified register address
@@ -3468,45 +4034,40 @@ class ModernApp:
             # Get the value from the StringVar
             value_str = value_var.get().strip()
             
-            # Validate value is a number and within allowed range
-            if not value_str.isdigit():
-                messagebox.showerror("Invalid Input", f"Value must be a number (received '{value_str}')")
+            # Validate format and safe range for setpoints (50-100%) in one pass
+            if not _SETPOINT_RE.fullmatch(value_str):
+                messagebox.showerror("Invalid Input", f"Setpoint must be a whole number between 50-100% (received '{value_str}')")
                 return
-                
             value = int(value_str)
-            # Enforce safe numeric range for setpoints (50-100%)
-            if value < 50 or value > 100:
-                messagebox.showerror("Invalid Input", f"Setpoint must be between 50-100% (received {value})")
-                return
             
-            # Connect to Modbus and write the value
+            # Write over the pooled connection; the lock keeps the two writes back to back
             ip = unit['ip_address']
-            client = ModbusTcpClient(ip)
-            
-            if client.connect():
-                # First set register 400509 to value 3
-                result_509 = client.write_register(address=509, value=3)
+            port = unit.get('port', _MODBUS_PORT)
+            slave = unit.get('unit_id', 1)
+            with self.connection_locks[(ip, port)]:
+                client = self.get_modbus_connection(ip, port)
                 
-                if result_509.isError():
-                    print(f"Error setting register 400509 to 3 for {unit['unit_name']}: {result_509}")
-                    client.close()
-                    return
-                else:
-                    print(f"Successfully set register 400509 to 3 for {unit['unit_name']}")
-                
-                # Then write the value to the main register (401212)
-                result = client.write_register(address=register_offset, value=value)
-                
-                if result.isError():
-                    print(f"Error writing to register {register_offset+400000} for {unit['unit_name']}: {result}")
+                if client:
+                    # First set register 400509 to value 3
+                    result_509 = client.write_register(address=509, value=3, slave=slave)
+                    
+                    if result_509.isError():
+                        print(f"Error setting register 400509 to 3 for {unit['unit_name']}: {result_509}")
+                        return
+                    else:
+                        print(f"Successfully set register 400509 to 3 for {unit['unit_name']}")
+                    
+                    # Then write the value to the main register (401212)
+                    result = client.write_register(address=register_offset, value=value, slave=slave)
+                    
+                    if result.isError():
+                        print(f"Error writing to register {register_offset+400000} for {unit['unit_name']}: {result}")
+                    else:
+                        print(f"Successfully wrote value {value} to register {register_offset+400000} for {unit['unit_name']}")
+                        # Clear the input box after successful write
+                        self.root.after(0, lambda var=value_var: var.set(""))
                 else:
-                    print(f"Successfully wrote value {value} to register {register_offset+400000} for {unit['unit_name']}")
-                    # Clear the input box after successful write
-                    self.root.after(0, lambda var=value_var: var.set(""))
-            else:
-                print(f"Failed to connect to {unit['unit_name']} at {ip}")
-                
-            client.close()
+                    print(f"Failed to connect to {unit['unit_name']} at {ip}")
             
         except Exception as e:
             print(f"Error in send_register_value: {e}")
@@ -3527,14 +4088,6 @@ class ModernApp:
         if self.monitoring_active:
             print("Stopping active monitoring before navigation")
             self.stop_monitoring()
-            
-            # Double check that all threads have indeed stopped or are stopping
-            active_count = sum(1 for thread in self.monitor_threads if thread.is_alive())
-            if active_count > 0:
-                print(f"Warning: {active_count} monitoring threads still active during navigation")
-                
-        # Ensure monitor_threads list is cleared
-        self.monitor_threads = []
         
         # Then return to main page
         self.load_existing_configuration()
@@ -3549,37 +4102,10 @@ class ModernApp:
         exe_path = os.path.join(folder_path, exe_file)
         
         if os.path.exists(exe_path):
-            # Similar to set_pump_assignment, kill other HMI processes first
-            try:
-                # Get list of running processes with their executable names
-                process_list = subprocess.check_output(['tasklist', '/FO', 'CSV', '/NH'],
-                                                      universal_newlines=True).split('\n')
-
-                # Get basenames of all exe files except the target
-                target_exe = os.path.basename(exe_path)
-                exe_basenames = [os.path.basename(exe) for exe in self.get_exe_files() if os.path.basename(exe) != target_exe]
-
-                # Kill each running process that matches our exe files
-                for process in process_list:
-                    if process:  # Skip empty lines
-                        try:
-                            process_name = process.split(',')[0].strip('"')
-                            if process_name in exe_basenames:
-                                subprocess.run(['taskkill', '/F', '/IM', process_name],
-                                              stdout=subprocess.DEVNULL,
-                                              stderr=subprocess.DEVNULL)
-                                time.sleep(0.1)  # Small delay to ensure process is killed
-                        except Exception as e:
-                            print(f"Error killing process {process_name}: {e}")
-            except Exception as e:
-                print(f"Error killing existing processes: {e}")
-            
-            # Launch the executable
-            try:
-                subprocess.Popen(exe_path)
-            except Exception as e:
-                print(f"Error launching HMI for unit {unit_name}: {e}")
-                messagebox.showerror("Launch Error", f"Could not launch HMI for unit {unit_name}\n\nError: {e}")
+            # Same path as set_pump_assignment: one psutil snapshot, in-process kills, then launch -
+            # all on the I/O pool (run_exe reports a failed launch)
+            self.exe_files = self.get_exe_files()
+            self.run_exe(exe_path)
         else:
             messagebox.showerror("File Not Found", f"HMI executable for unit {unit_name} not found at:\n{exe_path}")
             
@@ -3588,11 +4114,33 @@ class ModernApp:
         # Track current monitoring state before stopping
         self.was_monitoring_before_navigation = self.monitoring_active
         
-        # Stop any existing monitor threads
+        # Stop any running monitor polling
         self.stop_monitoring()
         
-        if self.current_frame:
-            self.current_frame.destroy()
+        # Find 230xx and LFPC folders and read their IP addresses
+        units_info = self.find_230xx_folders() + self.find_lfpc_folders()
+        
+        # Building a frame and a dozen labels per unit dominates navigation time, so the page is
+        # kept and re-shown for as long as the units and pump assignments stay the same
+        page_key = (tuple((unit['unit_name'], unit['ip_address']) for unit in units_info), self.get_unit_to_pump_map())
+        cached = self._operations_page
+        if cached is not None and cached[0] == page_key and self.show_cached_page('operations'):
+            # The cached widgets hang off the cached unit dicts, so poll those
+            _, self.units_info, self.grid_frame, self.start_button, self.stop_button = cached
+            self._widgets_alive = True
+            self.start_button.config(text="Start Monitoring", bg="#107c10")
+            self.stop_button.config(state='normal')
+            if self.was_monitoring_before_navigation:
+                self.root.after(100, self.start_operations_monitoring)  # Delay to ensure UI is ready
+            return
+        
+        # Out of date (or never built) - drop the old page and build a fresh one
+        stale = self._pages.pop('operations', (None,))[0]
+        self._operations_page = None
+        self.release_current_frame()
+        if stale is not None and stale.winfo_exists():
+            stale.destroy()
+        self.units_info = units_info
 
         # Set up the main frame
         self.current_frame = tk.Frame(self.root)
@@ -3615,9 +4163,6 @@ class ModernApp:
         separator = ttk.Separator(header_frame, orient='horizontal')
         separator.pack(fill='x', padx=50)
         
-        # Find 230xx and LFPC folders and read their IP addresses
-        self.units_info = self.find_230xx_folders() + self.find_lfpc_folders()
-        
         if not self.units_info:
             # Create a placeholder frame for consistent layout
             placeholder_frame = tk.Frame(self.current_frame, bg='#1e1e1e')
@@ -3656,6 +4201,7 @@ class ModernApp:
         # Create a frame for the units display with modern styling
         self.grid_frame = tk.Frame(self.current_frame, bg='#1e1e1e')
         self.grid_frame.pack(expand=True, fill='both', padx=10, pady=10)
+        self._watch_grid_frame()
         
         # Create monitor displays for each unit with operations data
         self.create_operations_monitors()
@@ -3720,41 +4266,33 @@ class ModernApp:
         )
         back_button.pack(side='left', padx=10, ipady=5)
         
+        # Keep the finished page for the next visit
+        self.cache_page('operations', expand=True, fill='both', padx=30, pady=20)
+        self._operations_page = (page_key, self.units_info, self.grid_frame, self.start_button, self.stop_button)
+        
         # Auto-start monitoring if it was active before navigation
         if self.was_monitoring_before_navigation:
             self.root.after(100, self.start_operations_monitoring)  # Delay to ensure UI is ready
 
+    def _build_ops_rows(self, parent, rows, widgets):
+        """Build side-by-side caption/value rows from (widget key, caption) pairs, storing each value label in widgets"""
+        # One grid of caption | value | caption | value columns instead of a row frame and two cell
+        # frames per row - fewer geometry-manager nodes to solve on every reconfigure
+        table = ttk.Frame(parent, style='Ops.TFrame')
+        table.pack(fill='x')
+        table.grid_columnconfigure((0, 2), weight=1)
+        for r, row in enumerate(rows):
+            for c, ((key, caption), padx) in enumerate(zip(row, ((0, 5), (5, 0)))):
+                ttk.Label(table, text=caption, style='Ops.TLabel').grid(row=r, column=2 * c, sticky='w', padx=(padx[0], 0), pady=2)
+                # ttk readout: colour updates go through 'foreground', not 'fg'
+                value = ttk.Label(table, text="---", style='OpsValue.TLabel', width=6)
+                value.grid(row=r, column=2 * c + 1, sticky='e', padx=(0, padx[1]), pady=2)
+                widgets[key] = value
+
     def create_operations_monitors(self):
         """Create monitoring displays for each unit with operations data"""
-        # Load pump assignments to map pump numbers to unit numbers
-        pump_assignments = self.load_assignments()
-        
-        # Create a mapping of unit numbers to their assigned pump numbers
-        unit_to_pump_map = {}
-        for pump_num, data in pump_assignments.items():
-            if data.get('exe_name') != 'Select Pump':
-                unit_to_pump_map[data.get('exe_name')] = pump_num
-        
-        # Sort units based on their pump assignments
-        sorted_units = []
-        unassigned_units = []
-        
-        for unit in self.units_info:
-            unit_name = unit['unit_name']
-            if unit_name in unit_to_pump_map.keys():
-                # Add pump number to unit info
-                unit['pump_number'] = unit_to_pump_map[unit_name]
-                sorted_units.append(unit)
-            else:
-                # Unit not assigned to any pump
-                unit['pump_number'] = None
-                unassigned_units.append(unit)
-        
-        # Sort units by pump number
-        sorted_units.sort(key=lambda u: int(u['pump_number']))
-        
-        # Add unassigned units at the end
-        all_units = sorted_units + unassigned_units
+        # Units ordered by pump assignment, unassigned units at the end
+        all_units = self.units_by_pump()
         
         # Calculate rows and columns (4 rows per column for better layout)
         rows_per_column = 4
@@ -3777,7 +4315,7 @@ class ModernApp:
             
             # Display format: "Pump # - Unit ###" if pump number exists
             if unit['pump_number'] is not None:
-                displayed_pump_num = int(unit['pump_number']) + 1
+                displayed_pump_num = unit['pump_number'] + 1
                 label_text = f"Pump {displayed_pump_num} - {unit['unit_name']}"
             else:
                 label_text = f" {unit['unit_name']}"
@@ -3812,50 +4350,9 @@ class ModernApp:
             is_lfpc = unit.get('unit_type') == 'LFPC'
             
             if is_lfpc:
-                # LFPC units: Gas Sub %, Load %, RPM
-                # First row: Gas Sub % and Load % side by side
-                first_row_frame = tk.Frame(data_frame, bg='#2d2d2d')
-                first_row_frame.pack(fill='x', pady=2)
-                
-                # Gas Sub % (left side)
-                gas_sub_frame = tk.Frame(first_row_frame, bg='#2d2d2d')
-                gas_sub_frame.pack(side='left', fill='x', expand=True, padx=(0, 5))
-                gas_sub_label_frame = tk.Frame(gas_sub_frame, bg='#2d2d2d')
-                gas_sub_label_frame.pack(fill='x')
-                tk.Label(gas_sub_label_frame, text="Gas Sub %:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                gas_sub_value = tk.Label(gas_sub_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                gas_sub_value.pack(side='right')
-                
-                # Load % (right side)
-                load_frame = tk.Frame(first_row_frame, bg='#2d2d2d')
-                load_frame.pack(side='right', fill='x', expand=True, padx=(5, 0))
-                load_label_frame = tk.Frame(load_frame, bg='#2d2d2d')
-                load_label_frame.pack(fill='x')
-                tk.Label(load_label_frame, text="Load %:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                load_value = tk.Label(load_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                load_value.pack(side='right')
-                
-                # Second row: RPM and Gear side by side
-                second_row_frame = tk.Frame(data_frame, bg='#2d2d2d')
-                second_row_frame.pack(fill='x', pady=2)
-                
-                # RPM (left side)
-                rpm_frame = tk.Frame(second_row_frame, bg='#2d2d2d')
-                rpm_frame.pack(side='left', fill='x', expand=True, padx=(0, 5))
-                rpm_label_frame = tk.Frame(rpm_frame, bg='#2d2d2d')
-                rpm_label_frame.pack(fill='x')
-                tk.Label(rpm_label_frame, text="RPM:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                rpm_value = tk.Label(rpm_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                rpm_value.pack(side='right')
-                
-                # Gear (right side)
-                gear_frame = tk.Frame(second_row_frame, bg='#2d2d2d')
-                gear_frame.pack(side='right', fill='x', expand=True, padx=(5, 0))
-                gear_label_frame = tk.Frame(gear_frame, bg='#2d2d2d')
-                gear_label_frame.pack(fill='x')
-                tk.Label(gear_label_frame, text="Gear:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                gear_value = tk.Label(gear_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                gear_value.pack(side='right')
+                # LFPC units: Gas Sub % / Load % and RPM / Gear rows, then the PPatrol indicator
+                operations_widgets = {}
+                self._build_ops_rows(data_frame, _LFPC_OPS_ROWS, operations_widgets)
                 
                 # Third row: PPatrol indicator (centered)
                 third_row_frame = tk.Frame(data_frame, bg='#2d2d2d')
@@ -3866,121 +4363,33 @@ class ModernApp:
                 ppatrol_frame.pack(expand=True)
                 ppatrol_indicator = tk.Label(ppatrol_frame, text="●", font=("Segoe UI", 16, "bold"), bg='#2d2d2d', fg='gray')
                 ppatrol_indicator.pack(side='left', padx=2)
-                tk.Label(ppatrol_frame, text="PPatrol", font=("Segoe UI", 8), bg='#2d2d2d', fg='white').pack(side='left', padx=(5, 0))
+                ttk.Label(ppatrol_frame, text="PPatrol", style='OpsCaption.TLabel').pack(side='left', padx=(5, 0))
                 
                 # Store LFPC widget references
                 unit['unit_frame'] = unit_frame
-                unit['operations_widgets'] = {
-                    'gas_sub_value': gas_sub_value,
-                    'load_value': load_value,
-                    'rpm_value': rpm_value,
-                    'gear_value': gear_value,
-                    'ppatrol_indicator': ppatrol_indicator
-                }
+                operations_widgets['ppatrol_indicator'] = ppatrol_indicator
+                unit['operations_widgets'] = operations_widgets
                 
             else:
-                # 230xx units: Env State, RPM, PE Oil Rate, GB Oil Rate, Gas PSI, indicators
-                # First row: Env State and RPM side by side
-                first_row_frame = tk.Frame(data_frame, bg='#2d2d2d')
-                first_row_frame.pack(fill='x', pady=2)
-                
-                # Env State (left side)
-                env_state_frame = tk.Frame(first_row_frame, bg='#2d2d2d')
-                env_state_frame.pack(side='left', fill='x', expand=True, padx=(0, 5))
-                env_label_frame = tk.Frame(env_state_frame, bg='#2d2d2d')
-                env_label_frame.pack(fill='x')
-                tk.Label(env_label_frame, text="Env State:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                envolts_value = tk.Label(env_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                envolts_value.pack(side='right')
-                
-                # RPM (right side)
-                rpm_frame = tk.Frame(first_row_frame, bg='#2d2d2d')
-                rpm_frame.pack(side='right', fill='x', expand=True, padx=(5, 0))
-                rpm_label_frame = tk.Frame(rpm_frame, bg='#2d2d2d')
-                rpm_label_frame.pack(fill='x')
-                tk.Label(rpm_label_frame, text="RPM:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                rpm_value = tk.Label(rpm_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                rpm_value.pack(side='right')
-            
-                # Second row: PE Oil Rate and GB Oil Rate side by side
-                second_row_frame = tk.Frame(data_frame, bg='#2d2d2d')
-                second_row_frame.pack(fill='x', pady=2)
-            
-                # PE Oil Rate (left side)
-                pe_oil_frame = tk.Frame(second_row_frame, bg='#2d2d2d')
-                pe_oil_frame.pack(side='left', fill='x', expand=True, padx=(0, 5))
-                pe_label_frame = tk.Frame(pe_oil_frame, bg='#2d2d2d')
-                pe_label_frame.pack(fill='x')
-                tk.Label(pe_label_frame, text="High Rate:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                pe_oil_value = tk.Label(pe_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                pe_oil_value.pack(side='right')
-            
-                # GB Oil Rate (right side)
-                gb_oil_frame = tk.Frame(second_row_frame, bg='#2d2d2d')
-                gb_oil_frame.pack(side='right', fill='x', expand=True, padx=(5, 0))
-                gb_label_frame = tk.Frame(gb_oil_frame, bg='#2d2d2d')
-                gb_label_frame.pack(fill='x')
-                tk.Label(gb_label_frame, text="Low Rate:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                gb_oil_value = tk.Label(gb_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                gb_oil_value.pack(side='right')
-            
-                # Third row: Gas PSI and Gear side by side
-                third_row_frame = tk.Frame(data_frame, bg='#2d2d2d')
-                third_row_frame.pack(fill='x', pady=2)
-            
-                # Gas PSI (left side)
-                gas_psi_frame = tk.Frame(third_row_frame, bg='#2d2d2d')
-                gas_psi_frame.pack(side='left', fill='x', expand=True, padx=(0, 5))
-                gas_label_frame = tk.Frame(gas_psi_frame, bg='#2d2d2d')
-                gas_label_frame.pack(fill='x')
-                tk.Label(gas_label_frame, text="Gas PSI:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                gas_psi_value = tk.Label(gas_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                gas_psi_value.pack(side='right')
-                
-                # Gear (right side)
-                gear_frame = tk.Frame(third_row_frame, bg='#2d2d2d')
-                gear_frame.pack(side='right', fill='x', expand=True, padx=(5, 0))
-                gear_label_frame = tk.Frame(gear_frame, bg='#2d2d2d')
-                gear_label_frame.pack(fill='x')
-                tk.Label(gear_label_frame, text="Gear:", font=("Segoe UI", 9), bg='#2d2d2d', fg='white').pack(side='left')
-                gear_value = tk.Label(gear_label_frame, text="---", font=("Segoe UI", 10, "bold"), bg='#1a1a1a', fg='#00ff00', relief='sunken', bd=1, width=6)
-                gear_value.pack(side='right')
+                # 230xx units: Env State / RPM, High / Low Rate and Gas PSI / Gear rows, then indicators
+                operations_widgets = {}
+                self._build_ops_rows(data_frame, _OPS_ROWS, operations_widgets)
                 
                 # Indicators frame
                 indicators_frame = tk.Frame(data_frame, bg='#2d2d2d')
                 indicators_frame.pack(fill='x', pady=3)
                 
                 # Create indicator lights for PPatrol, V1, V2, GLT
-                ppatrol_indicator = tk.Label(indicators_frame, text="●", font=("Segoe UI", 16, "bold"), bg='#2d2d2d', fg='gray')
-                ppatrol_indicator.pack(side='left', padx=2)
-                tk.Label(indicators_frame, text="PPatrol", font=("Segoe UI", 8), bg='#2d2d2d', fg='white').pack(side='left', padx=(0, 5))
-                
-                v1_indicator = tk.Label(indicators_frame, text="●", font=("Segoe UI", 12, "bold"), bg='#2d2d2d', fg='gray')
-                v1_indicator.pack(side='left', padx=2)
-                tk.Label(indicators_frame, text="V1", font=("Segoe UI", 8), bg='#2d2d2d', fg='white').pack(side='left', padx=(0, 5))
-                
-                v2_indicator = tk.Label(indicators_frame, text="●", font=("Segoe UI", 12, "bold"), bg='#2d2d2d', fg='gray')
-                v2_indicator.pack(side='left', padx=2)
-                tk.Label(indicators_frame, text="V2", font=("Segoe UI", 8), bg='#2d2d2d', fg='white').pack(side='left', padx=(0, 5))
-                
-                glt_indicator = tk.Label(indicators_frame, text="●", font=("Segoe UI", 12, "bold"), bg='#2d2d2d', fg='gray')
-                glt_indicator.pack(side='left', padx=2)
-                tk.Label(indicators_frame, text="GLT", font=("Segoe UI", 8), bg='#2d2d2d', fg='white').pack(side='left')
+                last = len(_OPS_INDICATORS) - 1
+                for i, (key, caption, size) in enumerate(_OPS_INDICATORS):
+                    indicator = tk.Label(indicators_frame, text="●", font=("Segoe UI", size, "bold"), bg='#2d2d2d', fg='gray')
+                    indicator.pack(side='left', padx=2)
+                    ttk.Label(indicators_frame, text=caption, style='OpsCaption.TLabel').pack(side='left', padx=(0, 5) if i < last else 0)
+                    operations_widgets[key] = indicator
                 
                 # Store 230xx widget references
                 unit['unit_frame'] = unit_frame  # Store unit frame for background flashing
-                unit['operations_widgets'] = {
-                    'rpm_value': rpm_value,
-                    'envolts_value': envolts_value,
-                    'pe_oil_value': pe_oil_value,
-                    'gb_oil_value': gb_oil_value,
-                    'gas_psi_value': gas_psi_value,
-                    'gear_value': gear_value,
-                    'ppatrol_indicator': ppatrol_indicator,
-                    'v1_indicator': v1_indicator,
-                    'v2_indicator': v2_indicator,
-                    'glt_indicator': glt_indicator
-                }
+                unit['operations_widgets'] = operations_widgets
 
     def start_operations_monitoring(self):
         """Start monitoring operations data for visible units only (selective polling)"""
@@ -3993,211 +4402,137 @@ class ModernApp:
         # Selective polling - only monitor units that are currently visible
         # For operations page, all units in self.units_info are visible
         self.visible_units = self.units_info.copy()
-        
-        # Create and start monitoring threads for each visible unit
+        # A new session polls everything straight away, whatever back-off the last one ended on
         for unit in self.visible_units:
-            thread = threading.Thread(target=self.monitor_operations_unit, args=(unit,), daemon=True)
-            thread.start()
-            self.monitor_threads.append(thread)
-
-    def monitor_operations_unit(self, unit):
-        """Monitor operations data for a single unit"""
+            unit['ops_stable'] = 0
+            unit['ops_next_poll'] = 0.0
+            unit['flashing'] = {}  # widget key -> (option, on colour, off colour), drawn by _flash_tick
+        
+        # Flashing alarms are animated by one Tk timer, independent of the poll rate
+        if self._flash_job is None:
+            self._flash_job = self.root.after(_FLASH_TICK_MS, self._flash_tick)
+        
+        # Poll every unit from the one event loop thread instead of a thread per unit
+        self._start_monitor_cycles(self.monitor_operations_unit, _OPS_POLL_INTERVAL)
+
+    async def monitor_operations_unit(self, unit):
+        """Poll operations data once for a single unit (scheduled by run_monitor_cycles)"""
+        # The operations page only displays values, so nobody is served by polling a minimized window -
+        # or one whose tiles are gone (_widgets_alive is the single per-page check, kept by <Destroy>)
+        if not self.monitoring_active or not self._window_visible or not self._widgets_alive:
+            return
+        # Units whose values have been steady are polled less often (see the back-off below)
+        if time.monotonic() < unit.get('ops_next_poll', 0.0):
+            return
         ip_address = unit['ip_address']
+        port = unit.get('port', _MODBUS_PORT)
+        slave = unit.get('unit_id', 1)
         widgets = unit.get('operations_widgets', {})
         is_lfpc = unit.get('unit_type') == 'LFPC'
+        pending = {}  # Widget key -> config options, applied in one Tk callback after the poll
+        client = None
         
-        while self.monitoring_active:
-            try:
-                # Use connection pooling for better performance
-                client = self.get_modbus_connection(ip_address)
-                if client:
-                    if is_lfpc:
-                        # LFPC unit monitoring - use batch reading to reduce requests
-                        # Batch read holding registers: RPM (246), Gas Sub (250), Gear (270)
-                        # Since 246-250 are close, read them together, then read 270 separately
-                        
-                        # Batch read RPM (246) and Gas Sub (250) - 5 registers to cover both
-                        batch_result = client.read_holding_registers(address=246, count=5)
-                        gear_display = "N"  # Default
-                        
-                        if not batch_result.isError():
-                            rpm_value = batch_result.registers[0]  # Address 246
-                            gas_sub_value = batch_result.registers[4]  # Address 250
-                            
-                            # Update RPM
-                            rpm_color = '#ff0000' if rpm_value == 0 else '#00ff00'  # Red if 0, green otherwise
-                            self.safe_widget_update(widgets.get('rpm_value'), text=str(rpm_value), fg=rpm_color)
-                            
-                            # Update Gas Sub (need gear for color logic, read separately)
-                            gear_result = client.read_holding_registers(address=270, count=1)
-                            if not gear_result.isError():
-                                gear_value = gear_result.registers[0]
-                                gear_display = str(gear_value) if 1 <= gear_value <= 9 else "N"
-                                # Set gear color: red for "N", white for valid gear numbers
-                                gear_color = '#ff0000' if gear_display == "N" else 'white'
-                                self.safe_widget_update(widgets.get('gear_value'), text=gear_display, fg=gear_color)
-                            
-                            # Gas Sub color logic
-                            if gear_display != "N" and gas_sub_value == 0:
-                                gas_sub_color = '#ff0000'  # Red
-                            else:
-                                gas_sub_color = '#00ff00'  # Green
-                            self.safe_widget_update(widgets.get('gas_sub_value'), text=f"{gas_sub_value}%", fg=gas_sub_color)
-                        
-                        # Read Load % (400373 -> 373) - separate read as it's far from others
-                        load_result = client.read_holding_registers(address=373, count=1)
-                        if not load_result.isError():
-                            load_value = load_result.registers[0]
-                            self.safe_widget_update(widgets.get('load_value'), text=f"{load_value}%")
-                        
-                        # Read PPatrol as floating point (308023 -> 8023) - assuming 2 registers for float
-                        ppatrol_result = client.read_input_registers(address=8023, count=2)
-                        if not ppatrol_result.isError():
-                            # Combine two 16-bit registers into a 32-bit value and convert to float
-                            import struct
-                            combined_value = (ppatrol_result.registers[0] << 16) | ppatrol_result.registers[1]
-                            ppatrol_value = struct.unpack('>f', struct.pack('>I', combined_value))[0]
-                            
-                            # PPatrol color logic - indicator flashing only
-                            if ppatrol_value > 80:
-                                # Flash PPatrol indicator red (no background flashing)
-                                unit['ppatrol_flash_state'] = getattr(unit, 'ppatrol_flash_state', True)
-                                unit['ppatrol_flash_state'] = not unit['ppatrol_flash_state']
-                                ppatrol_color = '#ff0000' if unit['ppatrol_flash_state'] else '#800000'  # Flashing red
-                            elif ppatrol_value > 60:
-                                ppatrol_color = '#ff0000'  # Red indicator
-                            elif ppatrol_value >= 45:
-                                ppatrol_color = '#ffaa00'  # Amber indicator
-                            else:
-                                ppatrol_color = '#00ff00'  # Green indicator
-                                
-                            # Update PPatrol indicator color only
-                            self.safe_widget_update(widgets.get('ppatrol_indicator'), fg=ppatrol_color)
-                    
-                    else:
-                        # 230xx unit monitoring
-                        # Read Engine RPM (400246 -> 246)
-                        rpm_result = client.read_holding_registers(address=246, count=1)
-                        if not rpm_result.isError():
-                            rpm_value = rpm_result.registers[0]
-                            rpm_color = '#ff0000' if rpm_value < 1200 else '#00ff00'  # Red if under 1200, green otherwise
-                            self.safe_widget_update(widgets.get('rpm_value'), text=str(rpm_value), fg=rpm_color)
-                    
-                        # Read Envolts State (302044 -> 2044)
-                        envolts_result = client.read_input_registers(address=2044, count=1)
-                        if not envolts_result.isError():
-                            envolts_value = envolts_result.registers[0]
-                            envolts_color = '#00ff00' if envolts_value == 5 else '#ff0000'  # Green if 5, red otherwise
-                            self.safe_widget_update(widgets.get('envolts_value'), text=str(envolts_value), fg=envolts_color)
-                    
-                        # Read PE Oil Rate (400494 -> 494) - 32-bit floating point from 2 registers
-                        pe_oil_result = client.read_holding_registers(address=494, count=2)
-                        if not pe_oil_result.isError():
-                            # Combine two 16-bit registers into a 32-bit value and convert to float
-                            import struct
-                            combined_value = (pe_oil_result.registers[0] << 16) | pe_oil_result.registers[1]
-                            pe_oil_value = struct.unpack('>f', struct.pack('>I', combined_value))[0]
-                            pe_oil_color = '#ff0000' if pe_oil_value < 34 else '#00ff00'  # Red if less than 34, green otherwise
-                            self.safe_widget_update(widgets.get('pe_oil_value'), text=f"{pe_oil_value:.2f}", fg=pe_oil_color)
-                    
-                        # Read GB Oil Rate (302033 -> 2033) - 32-bit floating point from 2 registers
-                        gb_oil_result = client.read_input_registers(address=2033, count=2)
-                        if not gb_oil_result.isError():
-                            # Combine two 16-bit registers into a 32-bit value and convert to float
-                            import struct
-                            combined_value = (gb_oil_result.registers[0] << 16) | gb_oil_result.registers[1]
-                            gb_oil_value = struct.unpack('>f', struct.pack('>I', combined_value))[0]
-                            gb_oil_color = '#ff0000' if gb_oil_value < 34 else '#00ff00'  # Red if less than 34, green otherwise
-                            self.safe_widget_update(widgets.get('gb_oil_value'), text=f"{gb_oil_value:.2f}", fg=gb_oil_color)
-                    
-                        # Read Gas PSI (302035 -> 2035)
-                        gas_psi_result = client.read_input_registers(address=2035, count=1)
-                        if not gas_psi_result.isError():
-                            gas_psi_value = gas_psi_result.registers[0]
-                            # Gas PSI color logic: below 85 = flashing red, below 100 = flashing amber, otherwise green
-                            if gas_psi_value < 85:
-                                # Store flashing red state
-                                unit['gas_psi_flash_state'] = getattr(unit, 'gas_psi_flash_state', True)
-                                unit['gas_psi_flash_state'] = not unit['gas_psi_flash_state']
-                                gas_psi_color = '#ff0000' if unit['gas_psi_flash_state'] else '#800000'  # Flashing red
-                            elif gas_psi_value < 100:
-                                # Store flashing amber state
-                                unit['gas_psi_flash_state'] = getattr(unit, 'gas_psi_flash_state', True)
-                                unit['gas_psi_flash_state'] = not unit['gas_psi_flash_state']
-                                gas_psi_color = '#ffaa00' if unit['gas_psi_flash_state'] else '#cc8800'  # Flashing amber
-                            else:
-                                gas_psi_color = '#00ff00'  # Green
-                            self.safe_widget_update(widgets.get('gas_psi_value'), text=str(gas_psi_value), fg=gas_psi_color)
-                    
-                        # Read Gear (400270 -> 270)
-                        gear_result = client.read_holding_registers(address=270, count=1)
-                        if not gear_result.isError():
-                            gear_value = gear_result.registers[0]
-                            # Display "N" if gear is not 1-9, otherwise display the gear number
-                            gear_display = str(gear_value) if 1 <= gear_value <= 9 else "N"
-                            # Set gear color: red for "N", white for valid gear numbers
-                            gear_color = '#ff0000' if gear_display == "N" else 'white'
-                            self.safe_widget_update(widgets.get('gear_value'), text=gear_display, fg=gear_color)
-                    
-                        # Read PPatrol as floating point (308023 -> 8023) - assuming 2 registers for float
-                        ppatrol_result = client.read_input_registers(address=8023, count=2)
-                        if not ppatrol_result.isError():
-                            # Combine two 16-bit registers into a 32-bit value and convert to float
-                            import struct
-                            combined_value = (ppatrol_result.registers[0] << 16) | ppatrol_result.registers[1]
-                            ppatrol_value = struct.unpack('>f', struct.pack('>I', combined_value))[0]
-                            
-                            # PPatrol color logic - indicator flashing only
-                            if ppatrol_value > 80:
-                                # Flash PPatrol indicator red (no background flashing)
-                                unit['ppatrol_flash_state'] = getattr(unit, 'ppatrol_flash_state', True)
-                                unit['ppatrol_flash_state'] = not unit['ppatrol_flash_state']
-                                ppatrol_color = '#ff0000' if unit['ppatrol_flash_state'] else '#800000'  # Flashing red
-                            elif ppatrol_value > 60:
-                                ppatrol_color = '#ff0000'  # Red indicator
-                            elif ppatrol_value >= 45:
-                                ppatrol_color = '#ffaa00'  # Amber indicator
-                            else:
-                                ppatrol_color = '#00ff00'  # Green indicator
-                                
-                            # Update PPatrol indicator color only
-                            self.safe_widget_update(widgets.get('ppatrol_indicator'), fg=ppatrol_color)
-                    
-                        # V1 (302002.05) - bit 5 of register 302002 -> 2002
-                        v1_result = client.read_input_registers(address=2002, count=1)
-                        if not v1_result.isError():
-                            v1_state = bool(v1_result.registers[0] & (1 << 5))
-                            color = '#00ff00' if v1_state else 'gray'
-                            self.safe_widget_update(widgets.get('v1_indicator'), fg=color)
-                        
-                        # V2 (302002.06) - bit 6 of register 302002 -> 2002
-                        v2_result = client.read_input_registers(address=2002, count=1)
-                        if not v2_result.isError():
-                            v2_state = bool(v2_result.registers[0] & (1 << 6))
-                            color = '#00ff00' if v2_state else 'gray'
-                            self.safe_widget_update(widgets.get('v2_indicator'), fg=color)
-                        
-                        # GLT (302002.07) - bit 7 of register 302002 -> 2002
-                        glt_result = client.read_input_registers(address=2002, count=1)
-                        if not glt_result.isError():
-                            glt_state = bool(glt_result.registers[0] & (1 << 7))
-                            color = '#00ff00' if glt_state else 'gray'
-                            self.safe_widget_update(widgets.get('glt_indicator'), fg=color)
-                    
-                    # Connection pooling - don't close client, it will be reused
-                    pass
-                    
-            except Exception as e:
-                print(f"Error monitoring operations for unit {unit['unit_name']} at {ip_address}: {e}")
-                # Update all widgets to show error state
-                for widget_name, widget in widgets.items():
-                    if 'indicator' in widget_name:
-                        self.safe_widget_update(widget, fg='red')
-                    else:
-                        self.safe_widget_update(widget, text="ERR")
-            
-            # Wait before next reading
-            time.sleep(2)
+        try:
+            # Use connection pooling for better performance
+            client = await self.get_async_modbus_connection(ip_address, port)
+            if client:
+                # Each window is one request; read_registers holds the connection's lock per request
+                # so units sharing a gateway still never have two requests outstanding on it
+                lock = self.async_connection_locks[(ip_address, port)]
+                # LFPC units read RPM, Gas Sub and Gear in one window plus Load % and PPatrol;
+                # 230xx units read ten values in four requests (holding 246..270 and 494..495,
+                # input 2002..2044 and 8023..8024)
+                holding_set, input_set, readouts = _LFPC_OPS_REGMAP if is_lfpc else _OPS_REGMAP
+                polled = {
+                    'holding': await self.read_registers(client.read_holding_registers, holding_set, slave, lock),
+                    'input': await self.read_registers(client.read_input_registers, input_set, slave, lock),
+                }
+                for table, address, key, decode, render in readouts:
+                    registers = polled[table]
+                    if address in registers:
+                        options, band = render(decode(registers, address))
+                        if band:
+                            self._set_band(unit, pending, key, band[0], band[1], options)
+                        else:
+                            pending[key] = options
+                
+                # V1, V2 and GLT are bits of register 302002 -> 2002, read once (230xx only)
+                inputs = polled['input']
+                if 2002 in inputs:
+                    reg2002 = inputs[2002]
+                    for key, mask in _REG2002_INDICATORS:
+                        pending[key] = {'fg': _OK_GREEN if reg2002 & mask else 'gray'}
+                
+                # Back off while the unit's display sits unchanged: one more interval per
+                # _OPS_STABLE_POLLS identical polls, up to _OPS_MAX_POLL_INTERVAL. A unit with a
+                # flashing alarm stays at the full rate so its recovery shows promptly.
+                steady = pending == unit.get('ops_last_pending') and not unit['flashing']
+                stable = unit.get('ops_stable', 0) + 1 if steady else 0
+                unit['ops_stable'] = stable
+                unit['ops_last_pending'] = pending
+                delay = min(_OPS_MAX_POLL_INTERVAL, _OPS_POLL_INTERVAL * (1 + stable // _OPS_STABLE_POLLS))
+                # Half an interval early, so cycle jitter can't push the poll a whole cycle late
+                unit['ops_next_poll'] = time.monotonic() + delay - _OPS_POLL_INTERVAL / 2
+                
+        except Exception as e:
+            print(f"Error monitoring operations for unit {unit['unit_name']} at {ip_address}: {e}")
+            # Errors go straight back to the normal rate
+            unit['ops_stable'] = 0
+            unit['ops_next_poll'] = 0.0
+            # The socket may be half-dead after a failed request; reconnect on the next poll
+            self._drop_async_connection((ip_address, port), client)
+            # Stop flashing stale alarm colours; the indicators below go solid red
+            unit['flashing'].clear()
+            # Update all widgets to show error state
+            for widget_name in widgets:
+                if 'indicator' in widget_name:
+                    pending[widget_name] = {'fg': 'red'}
+                else:
+                    pending[widget_name] = {'text': "ERR"}
+        finally:
+            # Merged into the next flush instead of one Tk event per widget, and nothing when nothing changed
+            # Nothing to draw on once the page's widgets are gone
+            if self._widgets_alive:
+                pending = self._changed_updates(unit, widgets, pending)
+                if pending:
+                    self._queue_updates(widgets, pending)
+
+    def _set_band(self, unit, pending, key, option, colors, options=None):
+        """Queue an alarm band's colour for widget key; a flashing band is handed to the flash timer instead"""
+        options = dict(options or {})
+        on, off = colors
+        flashing = unit['flashing']
+        if on == off:
+            if flashing.pop(key, None) is not None:
+                # The timer may have left the off colour showing, so don't let the memo skip the steady one
+                memo = unit.get('last_state')
+                if memo is not None:
+                    memo[1].pop(key, None)
+            options[option] = on
+        else:
+            flashing[key] = (option, on, off)
+        if options:
+            pending[key] = options
+
+    def _flash_tick(self):
+        """Toggle every flashing operations widget in step, then reschedule (Tk thread)"""
+        self._flash_phase = not self._flash_phase
+        if self._widgets_alive:
+            for unit in self.visible_units:
+                flashing = unit.get('flashing')
+                if not flashing:
+                    continue
+                widgets = unit.get('operations_widgets', {})
+                # Snapshot - the poller adds and removes entries from the loop thread
+                for key, (option, on, off) in list(flashing.items()):
+                    widget = widgets.get(key)
+                    if widget is None:
+                        continue
+                    try:
+                        widget.configure(**{option: on if self._flash_phase else off})
+                    except tk.TclError:
+                        pass
+        self._flash_job = self.root.after(_FLASH_TICK_MS, self._flash_tick)
 
     def load_existing_configuration(self):
         # Reset monitoring state tracking when navigating to main page
@@ -4213,23 +4548,22 @@ class ModernApp:
             self.auto_control_active = False
             
         try:
-            if os.path.exists('pump_assignments.json'):
-                with open('pump_assignments.json', 'r') as f:
-                    assignments = json.load(f)
-                    if assignments:
-                        # Get the number of pumps from the existing assignments
-                        num_pumps = max([int(k) for k in assignments.keys()]) + 1
-                        # Store the assignments before creating the main page
-                        self.pump_assignments = {int(k): {"exe_name": v["exe_name"]}
-                                              for k, v in assignments.items()}
-                        # Create the main page with the existing number of pumps
-                        self.create_main_page(num_pumps)
-                    else:
-                        messagebox.showwarning("No Configuration",
-                                             "No existing pump configuration found. Please use 'New Pumps or New Site'.")
+            # Parsed once per change to the file rather than on every return to this page
+            assignments = _load_json('pump_assignments.json')
+            if assignments:
+                # Get the number of pumps from the existing assignments
+                num_pumps = max([int(k) for k in assignments.keys()]) + 1
+                # Store the assignments before creating the main page
+                self.pump_assignments = {int(k): {"exe_name": v["exe_name"]}
+                                      for k, v in assignments.items()}
+                # Create the main page with the existing number of pumps
+                self.create_main_page(num_pumps)
             else:
                 messagebox.showwarning("No Configuration",
                                      "No existing pump configuration found. Please use 'New Pumps or New Site'.")
+        except FileNotFoundError:
+            messagebox.showwarning("No Configuration",
+                                 "No existing pump configuration found. Please use 'New Pumps or New Site'.")
         except Exception as e:
             messagebox.showerror("Error", f"Error loading configuration: {e}")
 